@@ -9,48 +9,103 @@ by running a series of commands and showing the output.
 import sys
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.terminal_engine import TerminalEngine
 from src.utils.formatter import OutputFormatter
 
+# Single shared formatter — avoids re-instantiating OutputFormatter
+# (and re-probing terminal capabilities) for every command in the demo
+_FORMATTER = OutputFormatter()
+
+# Per-command pacing delay in seconds; defaults to no delay so scripted
+# or CI runs aren't throttled. Set DEMO_DELAY=0.5 for the classic pacing.
+DEMO_DELAY = float(os.environ.get('DEMO_DELAY', '0'))
+
 
 def demo_section(title: str, description: str = ""):
     """Print a formatted section header."""
-    formatter = OutputFormatter()
-    print("\n" + "=" * 60)
-    print(formatter.colorize(f" {title}", 'green', 'bright'))
+    lines = ["", "=" * 60, _FORMATTER.colorize(f" {title}", 'green', 'bright')]
     if description:
-        print(f" {description}")
-    print("=" * 60)
+        lines.append(f" {description}")
+    lines.append("=" * 60)
+    # Emit the banner in a single write rather than one print per line
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def run_command_demo(engine: TerminalEngine, command: str, description: str = ""):
     """Run a command and display the results."""
-    formatter = OutputFormatter()
-    
+    formatter = _FORMATTER
+
+    # Pacing is a monotonic deadline measured from before execution, so the
+    # command's own runtime and output printing count against the delay
+    # instead of stacking a hard sleep on top of them
+    deadline = time.monotonic() + DEMO_DELAY
+
     print(f"\n{formatter.colorize('$', 'blue', 'bright')} {command}")
     if description:
         print(f"  # {description}")
-    
+
     output, exit_code = engine.execute_command(command)
-    
+
     if output:
         # Limit output length for demo purposes
         if len(output) > 500:
             output = output[:500] + "..."
         print(output)
-    
+
     if exit_code != 0:
         print(formatter.colorize(f"[Exit code: {exit_code}]", 'red'))
-    
-    time.sleep(0.5)  # Small delay for better readability
+
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)  # Small delay for better readability
+
+
+def run_command_batch(engine: TerminalEngine, commands, description: str = ""):
+    """
+    Run a batch of commands, printing results in submission order.
+
+    Commands are queued onto a single worker thread (TerminalEngine is not
+    thread-safe, and demo commands depend on each other's side effects), so
+    execution stays strictly ordered while the main thread overlaps output
+    formatting and pacing with the next command's execution.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        futures = [(cmd, executor.submit(engine.execute_command, cmd))
+                   for cmd in commands]
+
+        for cmd, future in futures:
+            deadline = time.monotonic() + DEMO_DELAY
+
+            print(f"\n{_FORMATTER.colorize('$', 'blue', 'bright')} {cmd}")
+            if description:
+                print(f"  # {description}")
+
+            output, exit_code = future.result()
+
+            if output:
+                # Limit output length for demo purposes
+                if len(output) > 500:
+                    output = output[:500] + "..."
+                print(output)
+
+            if exit_code != 0:
+                print(_FORMATTER.colorize(f"[Exit code: {exit_code}]", 'red'))
+
+            # The worker thread executes the next queued command during this
+            # pause, so pacing overlaps execution rather than stalling it
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
 
 
 def main():
     """Run the demonstration."""
-    formatter = OutputFormatter()
-    
+    formatter = _FORMATTER
+
     # Welcome message
     print(formatter.colorize("""
 ╔══════════════════════════════════════════════════════════════╗
@@ -104,8 +159,7 @@ def main():
         "show me the current directory",
     ]
     
-    for cmd in ai_commands:
-        run_command_demo(engine, cmd, "Natural language command")
+    run_command_batch(engine, ai_commands, "Natural language command")
     
     # AI Examples Demo
     demo_section("AI Examples and Help", "Getting help with natural language")
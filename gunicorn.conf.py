@@ -0,0 +1,19 @@
+"""Gunicorn configuration for the web terminal.
+
+Run with: gunicorn -c gunicorn.conf.py web_terminal:app
+"""
+
+import os
+
+bind = '0.0.0.0:%s' % os.environ.get('PORT', 5000)
+
+# eventlet workers serve WebSocket traffic on green threads, so thousands of
+# idle connections cost coroutine stacks instead of OS threads
+worker_class = 'eventlet'
+worker_connections = 1000
+
+# Terminal sessions live in process memory, so all traffic must land in one
+# worker; scale connection capacity with worker_connections, not workers
+workers = 1
+
+timeout = 60
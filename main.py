@@ -7,19 +7,90 @@ A fully functioning command terminal that mimics the behavior of a real system t
 
 import os
 import sys
-import signal
-import getpass
-import socket
+import functools
 from typing import Optional
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.terminal_engine import TerminalEngine
+from src.terminal_engine import TerminalEngine, TerminalExitRequested
 from src.utils.formatter import OutputFormatter
 from src.utils.error_handler import ErrorHandler
 
 
+@functools.lru_cache(maxsize=1)
+def _get_user_host() -> tuple:
+    """
+    Resolve the (username, hostname) pair once per process.
+
+    getpass.getuser() and socket.gethostname() hit the environment and a
+    syscall respectively, but are constants for the process lifetime, so
+    repeated PythonTerminal construction reuses the cached pair.
+    """
+    import getpass
+    import socket
+
+    try:
+        username = getpass.getuser()
+    except Exception:
+        username = "user"
+
+    try:
+        hostname = socket.gethostname().split('.')[0]
+    except Exception:
+        hostname = "localhost"
+
+    return username, hostname
+
+
+@functools.lru_cache(maxsize=2)
+def _build_welcome(use_colors: bool) -> str:
+    """
+    Build the (optionally colorized) welcome banner.
+
+    The banner content is constant, so the split-and-colorize work is done
+    once per color mode and cached for subsequent terminal instances.
+    """
+    welcome_text = """
+╔══════════════════════════════════════════════════════════════╗
+║                    Python Terminal v1.0                      ║
+║              A Python-based Command Terminal                 ║
+╚══════════════════════════════════════════════════════════════╝
+
+Welcome! This is a fully functional terminal implemented in Python.
+
+Features:
+• File and directory operations (ls, cd, mkdir, rm, cp, mv, etc.)
+• System monitoring (ps, top, free, df, uptime)
+• Command history and built-in help
+• Error handling and auto-suggestions
+• Colored output support
+
+Type 'help' for a list of available commands or 'exit' to quit.
+        """
+
+    if not use_colors:
+        return welcome_text
+
+    # Colorize the welcome message
+    formatter = OutputFormatter(use_colors=True)
+    colored_lines = []
+    for line in welcome_text.split('\n'):
+        if '║' in line and 'Python Terminal' in line:
+            colored_lines.append(formatter.colorize(line, 'green', 'bright'))
+        elif '║' in line and 'Python-based' in line:
+            colored_lines.append(formatter.colorize(line, 'cyan'))
+        elif line.startswith('Features:'):
+            colored_lines.append(formatter.colorize(line, 'yellow', 'bright'))
+        elif line.startswith('•'):
+            colored_lines.append(formatter.colorize(line, 'white'))
+        elif 'help' in line or 'exit' in line:
+            colored_lines.append(formatter.colorize(line, 'green'))
+        else:
+            colored_lines.append(line)
+    return '\n'.join(colored_lines)
+
+
 class PythonTerminal:
     """
     Main terminal application class.
@@ -36,28 +107,16 @@ class PythonTerminal:
         self.engine = TerminalEngine()
         self.formatter = OutputFormatter(use_colors=use_colors)
         self.error_handler = ErrorHandler(debug_mode=debug_mode)
-        
-        # Get system information
-        try:
-            self.username = getpass.getuser()
-        except Exception:
-            self.username = "user"
-        
-        try:
-            self.hostname = socket.gethostname().split('.')[0]
-        except Exception:
-            self.hostname = "localhost"
-        
-        # Set up signal handlers
-        signal.signal(signal.SIGINT, self._handle_interrupt)
-        
+
+        # Get system information (resolved once per process)
+        self.username, self.hostname = _get_user_host()
+
+        # Ctrl+C is handled by the run loop's `except KeyboardInterrupt`
+        # via Python's default SIGINT handling; a custom signal handler
+        # would double up on prompt redraws and formatter work.
+
         self.running = True
-    
-    def _handle_interrupt(self, signum, frame):
-        """Handle Ctrl+C interrupt."""
-        print("\n" + self.error_handler.handle_keyboard_interrupt())
-        self._show_prompt()
-    
+
     def _show_prompt(self):
         """Display the command prompt."""
         current_dir = self.engine.get_current_directory()
@@ -66,44 +125,12 @@ class PythonTerminal:
     
     def _show_welcome_message(self):
         """Display welcome message."""
-        welcome_text = """
-╔══════════════════════════════════════════════════════════════╗
-║                    Python Terminal v1.0                      ║
-║              A Python-based Command Terminal                 ║
-╚══════════════════════════════════════════════════════════════╝
+        welcome_text = _build_welcome(self.formatter.use_colors)
 
-Welcome! This is a fully functional terminal implemented in Python.
-
-Features:
-• File and directory operations (ls, cd, mkdir, rm, cp, mv, etc.)
-• System monitoring (ps, top, free, df, uptime)
-• Command history and built-in help
-• Error handling and auto-suggestions
-• Colored output support
-
-Type 'help' for a list of available commands or 'exit' to quit.
-        """
-        
-        if self.formatter.use_colors:
-            # Colorize the welcome message
-            lines = welcome_text.split('\n')
-            colored_lines = []
-            for line in lines:
-                if '║' in line and 'Python Terminal' in line:
-                    colored_lines.append(self.formatter.colorize(line, 'green', 'bright'))
-                elif '║' in line and 'Python-based' in line:
-                    colored_lines.append(self.formatter.colorize(line, 'cyan'))
-                elif line.startswith('Features:'):
-                    colored_lines.append(self.formatter.colorize(line, 'yellow', 'bright'))
-                elif line.startswith('•'):
-                    colored_lines.append(self.formatter.colorize(line, 'white'))
-                elif 'help' in line or 'exit' in line:
-                    colored_lines.append(self.formatter.colorize(line, 'green'))
-                else:
-                    colored_lines.append(line)
-            welcome_text = '\n'.join(colored_lines)
-        
-        print(welcome_text)
+        # Single write instead of per-line prints: one stdout lock
+        # acquisition and one syscall when output is piped
+        sys.stdout.write(welcome_text + '\n')
+        sys.stdout.flush()
     
     def _process_command(self, command_line: str) -> bool:
         """
@@ -117,7 +144,7 @@ Type 'help' for a list of available commands or 'exit' to quit.
         """
         try:
             output, exit_code = self.engine.execute_command(command_line)
-            
+
             # Display output if there is any
             if output:
                 if exit_code != 0:
@@ -125,10 +152,12 @@ Type 'help' for a list of available commands or 'exit' to quit.
                     print(self.formatter.format_error(output))
                 else:
                     print(output)
-            
-            # Check if the engine is still running
-            return self.engine.is_running()
-            
+
+            return True
+
+        except TerminalExitRequested as e:
+            print(str(e))
+            return False
         except KeyboardInterrupt:
             print("\n" + self.error_handler.handle_keyboard_interrupt())
             return True
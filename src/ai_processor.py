@@ -6,8 +6,33 @@ queries into terminal commands.
 """
 
 import re
+import sys
 from typing import List, Dict, Optional, Tuple
 
+# Precompiled cleanup pattern shared by _clean_path and _clean_filename:
+# strips stopwords and collapses whitespace runs in a single substitution pass
+_CLEAN_RE = re.compile(r'\s*\b(?:the|a|an|this|that)\b\s*|\s+', re.IGNORECASE)
+
+# Natural language indicators for is_natural_language_query, fused into a
+# single union so one search call replaces four
+_NL_UNION = re.compile(
+    r'\b(?:show|list|display|what|how|where|find|search|create|make|delete|remove'
+    r'|me|the|a|an|this|that|some|all'
+    r'|can|could|would|should|will)\b'
+    r'|\?$'  # Ends with question mark
+)
+
+# Direct command shapes (less likely to be natural language), fused likewise
+_CMD_UNION = re.compile(
+    r'^(?:[a-zA-Z_-]+(?:\s+[^\s]+)*$'  # Simple command format
+    r'|[a-zA-Z_-]+\s+-[a-zA-Z]+)'      # Command with flags
+)
+
+_SHOW_LIST_DISPLAY_RE = re.compile(r'\b(?:show|list|display)\b')
+
+# Tokenizer for keyword-based suggestion matching
+_TOKEN_RE = re.compile(r'[a-z]+')
+
 
 class AIProcessor:
     """
@@ -17,13 +42,105 @@ class AIProcessor:
     def __init__(self):
         """Initialize the AI processor with command patterns."""
         self.command_patterns = self._initialize_patterns()
+        self._build_mega_pattern()
+        # Memoization caches: interactive queries repeat often (retyped
+        # phrases, demo loops), so repeat lookups skip the regex work
+        self._query_cache: Dict[str, Optional[str]] = {}
+        self._nl_cache: Dict[str, bool] = {}
+        self._suggestion_cache: Dict[str, List[str]] = {}
+
+    _CACHE_MAX = 512
+
+    # Keyword groups for get_suggestions, matched by set intersection
+    _LIST_KEYWORDS = frozenset({'list', 'show', 'display'})
+    _CREATE_KEYWORDS = frozenset({'create', 'make', 'new'})
+    _DELETE_KEYWORDS = frozenset({'delete', 'remove', 'rm'})
+    _SEARCH_KEYWORDS = frozenset({'find', 'search', 'locate'})
+    _SYSTEM_KEYWORDS = frozenset({'process', 'processes', 'running', 'system'})
+
+    @staticmethod
+    def _cache_put(cache: Dict, key: str, value) -> None:
+        """Insert into a bounded cache, evicting the oldest entry when full."""
+        if len(cache) >= AIProcessor._CACHE_MAX:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+    def _build_mega_pattern(self) -> None:
+        """
+        Fuse all intent patterns into a single alternation regex.
+
+        Each pattern becomes a named alternative ``(?P<g{i}>...)`` so one
+        search call scans the query against every intent at once instead of
+        looping over ~40 patterns sequentially. A parallel entries list maps
+        the matched group name back to its template, intent, and the slice of
+        capture groups belonging to that pattern.
+        """
+        parts = []
+        entries = []
+        for intent, pattern_list in self.command_patterns.items():
+            for pattern, template in pattern_list:
+                i = len(entries)
+                parts.append(f'(?P<g{i}>{pattern.pattern})')
+                kind = self._template_kind(template)
+                if kind == 'literal':
+                    # Literal templates ("ls", "pwd", ...) are returned as-is,
+                    # so intern them once and hand out the shared constant
+                    template = sys.intern(template)
+                entries.append((intent, template, pattern.groups, kind))
+        self._mega_pattern = re.compile('|'.join(parts), re.IGNORECASE)
+        self._mega_entries = entries
+        self._build_first_word_index(parts)
+
+    def _build_first_word_index(self, parts: List[str]) -> None:
+        """
+        Index patterns by their leading verb so process_query can try a much
+        smaller alternation when the query's first word is a known verb.
+
+        Patterns whose leading tokens can't be determined statically are
+        included in every bucket; a bucket miss always falls back to the
+        full alternation, so the index is purely an optimization.
+        """
+        buckets: Dict[str, List[int]] = {}
+        universal: List[int] = []
+        for i, (pattern, _) in enumerate(
+                (p, t) for plist in self.command_patterns.values() for p, t in plist):
+            tokens = self._leading_tokens(pattern.pattern)
+            if tokens:
+                for token in tokens:
+                    buckets.setdefault(token, []).append(i)
+            else:
+                universal.append(i)
+
+        self._by_first_word: Dict[str, 're.Pattern'] = {}
+        for token, indices in buckets.items():
+            selected = sorted(set(indices) | set(universal))
+            self._by_first_word[token] = re.compile(
+                '|'.join(parts[i] for i in selected), re.IGNORECASE)
+
+    @staticmethod
+    def _leading_tokens(pattern_text: str) -> set:
+        """Extract the possible leading words of a raw pattern, if static."""
+        text = pattern_text.lstrip('^')
+        group_match = re.match(r'\(\?:([^()]*)\)', text)
+        alternatives = group_match.group(1).split('|') if group_match else [text]
+
+        tokens = set()
+        for alt in alternatives:
+            word = re.match(r'[a-z]+', alt)
+            if not word:
+                return set()
+            tokens.add(word.group())
+        return tokens
     
-    def _initialize_patterns(self) -> Dict[str, List[Tuple[str, str]]]:
+    def _initialize_patterns(self) -> Dict[str, List[Tuple['re.Pattern', str]]]:
         """
         Initialize natural language patterns and their corresponding commands.
-        
+
+        Patterns are compiled once here so that process_query doesn't pay
+        re-cache lookup and parsing costs on every call.
+
         Returns:
-            Dictionary mapping intent types to (pattern, command) tuples
+            Dictionary mapping intent types to (compiled_pattern, command) tuples
         """
         patterns = {
             'file_listing': [
@@ -95,8 +212,13 @@ class AIProcessor:
                 (r"clear\s+(?:the\s+)?(?:screen|terminal)", "clear"),
             ],
         }
-        
-        return patterns
+
+        # Compile every pattern once at init time
+        return {
+            intent: [(re.compile(pattern, re.IGNORECASE), command)
+                     for pattern, command in pattern_list]
+            for intent, pattern_list in patterns.items()
+        }
     
     def process_query(self, query: str) -> Optional[str]:
         """
@@ -109,79 +231,117 @@ class AIProcessor:
             Terminal command string or None if no match found
         """
         query = query.strip().lower()
-        
+
         if not query:
             return None
-        
-        # Try to match against all patterns
-        for intent, pattern_list in self.command_patterns.items():
-            for pattern, command_template in pattern_list:
-                match = re.search(pattern, query, re.IGNORECASE)
-                if match:
-                    # Extract captured groups
-                    groups = match.groups()
-                    
-                    # Replace placeholders in command template
-                    command = self._format_command(command_template, groups, intent)
-                    
-                    if command:
-                        return command
-        
+
+        if query in self._query_cache:
+            return self._query_cache[query]
+
+        # Prefilter on the query's first word, then fall back to a single
+        # scan against the fused alternation of all patterns
+        first_word = query.split(None, 1)[0]
+        bucket = self._by_first_word.get(first_word)
+        match = bucket.search(query) if bucket is not None else None
+        if match is None:
+            match = self._mega_pattern.search(query)
+        if match:
+            intent, command_template, group_count, kind = \
+                self._mega_entries[int(match.lastgroup[1:])]
+
+            # Extract the capture groups belonging to the matched pattern;
+            # they immediately follow its named group in whichever fused
+            # pattern (bucket or full) produced the match
+            if group_count:
+                group_start = match.re.groupindex[match.lastgroup] + 1
+                groups = match.group(*range(group_start, group_start + group_count)) \
+                    if group_count > 1 else (match.group(group_start),)
+            else:
+                groups = ()
+
+            # Replace placeholders via the formatter precomputed for this
+            # template's kind — no branch cascade or try/except on the hot path
+            command = self._FORMATTERS[kind](self, command_template, groups)
+
+            if command:
+                self._cache_put(self._query_cache, query, command)
+                return command
+
+        self._cache_put(self._query_cache, query, None)
         return None
     
+    @staticmethod
+    def _template_kind(template: str) -> str:
+        """Classify a command template by its placeholder, done once at init."""
+        if '{path}' in template:
+            return 'path'
+        elif '{name}' in template:
+            return 'name'
+        elif '{source}' in template and '{dest}' in template:
+            return 'src_dst'
+        elif '{target}' in template:
+            return 'target'
+        elif '{file}' in template:
+            return 'file'
+        else:
+            return 'literal'
+
+    def _format_path(self, template: str, groups: Tuple) -> Optional[str]:
+        path = self._clean_path(groups[0] if groups and groups[0] else '.')
+        return template.replace('{path}', path)
+
+    def _format_name(self, template: str, groups: Tuple) -> Optional[str]:
+        name = self._clean_filename(groups[0] if groups and groups[0] else '')
+        if not name:
+            return None
+        return template.replace('{name}', name)
+
+    def _format_src_dst(self, template: str, groups: Tuple) -> Optional[str]:
+        if len(groups) < 2:
+            return None
+        source = self._clean_path(groups[0])
+        dest = self._clean_path(groups[1])
+        return template.replace('{source}', source).replace('{dest}', dest)
+
+    def _format_target(self, template: str, groups: Tuple) -> Optional[str]:
+        target = self._clean_path(groups[0] if groups and groups[0] else '')
+        if not target:
+            return None
+        return template.replace('{target}', target)
+
+    def _format_file(self, template: str, groups: Tuple) -> Optional[str]:
+        file = self._clean_path(groups[0] if groups and groups[0] else '')
+        if not file:
+            return None
+        return template.replace('{file}', file)
+
+    def _format_literal(self, template: str, groups: Tuple) -> str:
+        # No placeholders, return template as-is
+        return template
+
+    # Dispatch table keyed by template kind, built once at class definition
+    _FORMATTERS = {
+        'path': _format_path,
+        'name': _format_name,
+        'src_dst': _format_src_dst,
+        'target': _format_target,
+        'file': _format_file,
+        'literal': _format_literal,
+    }
+
     def _format_command(self, template: str, groups: Tuple, intent: str) -> Optional[str]:
         """
         Format a command template with captured groups.
-        
+
         Args:
             template: Command template string
             groups: Captured groups from regex match
             intent: The intent type
-            
+
         Returns:
             Formatted command string or None if formatting fails
         """
-        try:
-            # Handle different placeholder patterns
-            if '{path}' in template:
-                path = groups[0] if groups and groups[0] else '.'
-                path = self._clean_path(path)
-                return template.replace('{path}', path)
-            
-            elif '{name}' in template:
-                name = groups[0] if groups and groups[0] else ''
-                name = self._clean_filename(name)
-                if not name:
-                    return None
-                return template.replace('{name}', name)
-            
-            elif '{source}' in template and '{dest}' in template:
-                if len(groups) >= 2:
-                    source = self._clean_path(groups[0])
-                    dest = self._clean_path(groups[1])
-                    return template.replace('{source}', source).replace('{dest}', dest)
-                return None
-            
-            elif '{target}' in template:
-                target = groups[0] if groups and groups[0] else ''
-                target = self._clean_path(target)
-                if not target:
-                    return None
-                return template.replace('{target}', target)
-            
-            elif '{file}' in template:
-                file = groups[0] if groups and groups[0] else ''
-                file = self._clean_path(file)
-                if not file:
-                    return None
-                return template.replace('{file}', file)
-            
-            else:
-                # No placeholders, return template as-is
-                return template
-                
-        except Exception:
-            return None
+        return self._FORMATTERS[self._template_kind(template)](self, template, groups)
     
     def _clean_path(self, path: str) -> str:
         """
@@ -196,16 +356,11 @@ class AIProcessor:
         if not path:
             return '.'
         
-        # Remove common words that might interfere
-        path = re.sub(r'\b(?:the|a|an|this|that)\b\s*', '', path, flags=re.IGNORECASE)
-        
-        # Remove extra whitespace
-        path = ' '.join(path.split())
-        
+        # Remove common words and collapse whitespace in one pass
+        path = _CLEAN_RE.sub(' ', path).strip()
+
         # Handle quoted paths
-        if path.startswith('"') and path.endswith('"'):
-            path = path[1:-1]
-        elif path.startswith("'") and path.endswith("'"):
+        if len(path) >= 2 and path[0] in ('"', "'") and path[-1] == path[0]:
             path = path[1:-1]
         
         # Convert spaces to underscores if no quotes and contains spaces
@@ -229,16 +384,11 @@ class AIProcessor:
         if not filename:
             return ''
         
-        # Remove common words
-        filename = re.sub(r'\b(?:the|a|an|this|that)\b\s*', '', filename, flags=re.IGNORECASE)
-        
-        # Remove extra whitespace
-        filename = ' '.join(filename.split())
-        
+        # Remove common words and collapse whitespace in one pass
+        filename = _CLEAN_RE.sub(' ', filename).strip()
+
         # Handle quoted filenames
-        if filename.startswith('"') and filename.endswith('"'):
-            filename = filename[1:-1]
-        elif filename.startswith("'") and filename.endswith("'"):
+        if len(filename) >= 2 and filename[0] in ('"', "'") and filename[-1] == filename[0]:
             filename = filename[1:-1]
         
         # Convert spaces to underscores or suggest quoting
@@ -261,25 +411,34 @@ class AIProcessor:
             List of suggested commands
         """
         query_lower = query.lower()
+
+        if query_lower in self._suggestion_cache:
+            return list(self._suggestion_cache[query_lower])
+
+        # Tokenize once so each keyword group is a hashed set intersection
+        # instead of repeated substring scans over the whole query
+        tokens = set(_TOKEN_RE.findall(query_lower))
         suggestions = []
-        
+
         # Keyword-based suggestions
-        if any(word in query_lower for word in ['list', 'show', 'display']):
+        if tokens & self._LIST_KEYWORDS:
             suggestions.extend(['ls', 'ls -la', 'pwd', 'ps aux'])
-        
-        if any(word in query_lower for word in ['create', 'make', 'new']):
+
+        if tokens & self._CREATE_KEYWORDS:
             suggestions.extend(['mkdir <directory>', 'touch <file>', 'cp <source> <dest>'])
-        
-        if any(word in query_lower for word in ['delete', 'remove', 'rm']):
+
+        if tokens & self._DELETE_KEYWORDS:
             suggestions.extend(['rm <file>', 'rm -r <directory>', 'rmdir <directory>'])
-        
-        if any(word in query_lower for word in ['find', 'search', 'locate']):
+
+        if tokens & self._SEARCH_KEYWORDS:
             suggestions.extend(['find . -name "<pattern>"', 'find <path> -name "<pattern>"'])
-        
-        if any(word in query_lower for word in ['process', 'running', 'system']):
+
+        if tokens & self._SYSTEM_KEYWORDS:
             suggestions.extend(['ps aux', 'top', 'free -h', 'df -h', 'uptime'])
         
-        return suggestions[:5]  # Return top 5 suggestions
+        suggestions = suggestions[:5]  # Keep top 5 suggestions
+        self._cache_put(self._suggestion_cache, query_lower, suggestions)
+        return list(suggestions)
     
     def is_natural_language_query(self, query: str) -> bool:
         """
@@ -292,57 +451,49 @@ class AIProcessor:
             True if it looks like natural language, False if it looks like a command
         """
         query = query.strip().lower()
-        
-        # Check for common natural language indicators
-        natural_indicators = [
-            r'\b(?:show|list|display|what|how|where|find|search|create|make|delete|remove)\b',
-            r'\b(?:me|the|a|an|this|that|some|all)\b',
-            r'\b(?:can|could|would|should|will)\b',
-            r'\?$',  # Ends with question mark
-        ]
-        
-        for pattern in natural_indicators:
-            if re.search(pattern, query):
-                return True
-        
-        # Check for direct command patterns (less likely to be natural language)
-        command_patterns = [
-            r'^[a-zA-Z_-]+(\s+[^\s]+)*$',  # Simple command format
-            r'^[a-zA-Z_-]+\s+-[a-zA-Z]+',  # Command with flags
-        ]
-        
-        for pattern in command_patterns:
-            if re.match(pattern, query) and not re.search(r'\b(?:show|list|display)\b', query):
-                return False
-        
-        return True
+
+        if query in self._nl_cache:
+            return self._nl_cache[query]
+
+        if _NL_UNION.search(query):
+            # Contains a common natural language indicator
+            result = True
+        else:
+            # A direct command shape (and no listing verb) is not natural language
+            result = not (_CMD_UNION.match(query)
+                          and not _SHOW_LIST_DISPLAY_RE.search(query))
+
+        self._cache_put(self._nl_cache, query, result)
+        return result
     
+    # Example queries are constant; stored once as a class-level tuple so
+    # each call avoids rebuilding a 20-element literal list
+    _EXAMPLES = (
+        "show me the files in this directory",
+        "create a new folder called projects",
+        "copy file.txt to backup folder",
+        "find all python files",
+        "what processes are running",
+        "show system memory usage",
+        "go to the home directory",
+        "delete the old file",
+        "delete project",
+        "remove folder called test",
+        "delete directory named backup",
+        "show me the current directory",
+        "list all files including hidden ones",
+        "create an empty file called readme.txt",
+        "move documents to archive folder",
+        "where am I?",
+        "what's in the Documents folder?",
+        "make a directory named test",
+    )
+
     def get_example_queries(self) -> List[str]:
         """
         Get example natural language queries that the processor can handle.
-        
+
         Returns:
             List of example queries
         """
-        examples = [
-            "show me the files in this directory",
-            "create a new folder called projects",
-            "copy file.txt to backup folder",
-            "find all python files",
-            "what processes are running",
-            "show system memory usage",
-            "go to the home directory",
-            "delete the old file",
-            "delete project",
-            "remove folder called test",
-            "delete directory named backup",
-            "show me the current directory",
-            "list all files including hidden ones",
-            "create an empty file called readme.txt",
-            "move documents to archive folder",
-            "where am I?",
-            "what's in the Documents folder?",
-            "make a directory named test",
-        ]
-        
-        return examples
\ No newline at end of file
+        return list(self._EXAMPLES)
\ No newline at end of file
@@ -3,237 +3,452 @@ Command Parser
 
 This module handles parsing command line input, including handling
 quotes, escape characters, and argument splitting.
+
+All parsing operations are stateless, so they live as module-level
+functions (importable directly for hot paths); CommandParser remains
+as a thin facade so existing `CommandParser().parse_command(...)`
+call sites keep working without paying bound-method overhead per call.
 """
 
+import glob
+import os
 import shlex
 import re
+import sys
+import functools
 from typing import List, Tuple, Optional
 
+# Characters that require full shlex quoting/escape semantics
+_NEEDS_SHLEX_RE = re.compile(r'["\'\\]')
 
-class CommandParser:
+# Shell wildcard characters, detected with one C-level scan
+_WILDCARD_RE = re.compile(r'[*?\[]')
+
+# Standalone redirection operators: operator -> (field, append_mode)
+_REDIR_TWO_ARG = {
+    '>': ('output', False),
+    '>>': ('output', True),
+    '<': ('input', False),
+}
+
+# Inline redirections like >file, >>file, <file: operator and filename
+# extracted in a single match instead of repeated startswith/slice passes
+_INLINE_REDIR = re.compile(r'^(>>?|<)(.+)$')
+
+# Quote-tracking scanner states for split_pipeline
+_ST_DEFAULT, _ST_SINGLE, _ST_DOUBLE = 0, 1, 2
+# Pseudo-state signalling an unquoted '|' was seen
+_ST_SPLIT = 3
+
+
+def _build_pipe_transitions():
+    """
+    Build the split_pipeline DFA table: _TRANSITIONS[state][byte] gives
+    the next state, replacing the per-character branch chain with a
+    single table lookup. Only quotes and the pipe change state; every
+    other byte maps back to the current state.
+    """
+    table = [[state] * 256 for state in (_ST_DEFAULT, _ST_SINGLE, _ST_DOUBLE)]
+    table[_ST_DEFAULT][ord("'")] = _ST_SINGLE
+    table[_ST_DEFAULT][ord('"')] = _ST_DOUBLE
+    table[_ST_DEFAULT][ord('|')] = _ST_SPLIT
+    table[_ST_SINGLE][ord("'")] = _ST_DEFAULT
+    table[_ST_DOUBLE][ord('"')] = _ST_DEFAULT
+    return table
+
+
+_TRANSITIONS = _build_pipe_transitions()
+
+
+def _split_tokens(command_line: str) -> List[str]:
     """
-    Parses command line input into command and arguments.
+    Tokenize a command line, taking a fast path for simple input.
+
+    Most interactive commands contain no quotes or escapes, so a plain
+    str.split (a single C-level scan) sidesteps shlex's per-character
+    pure-Python state machine. Anything containing quote or escape
+    characters falls back to shlex.split for full POSIX semantics.
     """
-    
+    if _NEEDS_SHLEX_RE.search(command_line) is None:
+        return command_line.split()
+    return shlex.split(command_line)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(command_line: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Tokenize a stripped command line into (command, args), memoized.
+
+    Interactive shells re-issue the same lines constantly (up-arrow
+    recalls, retyped commands), so repeat parses become a dict lookup.
+    The cached value is an immutable tuple; callers copy before mutating.
+    """
+    try:
+        tokens = _split_tokens(command_line)
+    except ValueError:
+        # Handle unclosed quotes or other parsing errors
+        # Fall back to simple split
+        tokens = command_line.split()
+
+    if not tokens:
+        return "", ()
+
+    # Intern the command name so dispatch-table lookups hit the
+    # pointer-equality fast path instead of full string comparison
+    return sys.intern(tokens[0]), tuple(tokens[1:])
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_path(path: str, current_dir: str) -> str:
+    """
+    Normalize a path against a directory, memoized per (path, dir) pair.
+
+    os.path.join returns the second argument verbatim when it is absolute
+    (after ~ expansion), so no separate isabs branch is needed. Completion
+    and repeated commands resolve the same paths constantly, so cache hits
+    skip the whole string-munging pipeline.
+    """
+    return os.path.normpath(os.path.join(current_dir, os.path.expanduser(path)))
+
+
+class CommandTrie:
+    """
+    Prefix trie over command names for O(len(name)) dispatch lookup and
+    tab-completion, instead of scanning flat command lists per keystroke.
+    """
+
+    # Sentinel key marking a complete command on a node
+    _END = ''
+
     def __init__(self):
-        """Initialize the command parser."""
-        pass
-    
-    def parse_command(self, command_line: str) -> Tuple[str, List[str]]:
-        """
-        Parse a command line into command and arguments.
-        
-        Args:
-            command_line: The raw command line string
-            
-        Returns:
-            Tuple of (command, arguments_list)
-        """
-        command_line = command_line.strip()
-        
-        if not command_line:
-            return "", []
-        
-        try:
-            # Use shlex to properly handle quotes and escapes
-            tokens = shlex.split(command_line)
-        except ValueError as e:
-            # Handle unclosed quotes or other parsing errors
-            # Fall back to simple split
-            tokens = command_line.split()
-        
-        if not tokens:
-            return "", []
-        
-        command = tokens[0]
-        args = tokens[1:] if len(tokens) > 1 else []
-        
-        return command, args
-    
-    def parse_options(self, args: List[str]) -> Tuple[List[str], List[str]]:
-        """
-        Separate options (starting with -) from regular arguments.
-        
-        Args:
-            args: List of command arguments
-            
-        Returns:
-            Tuple of (options, remaining_args)
-        """
-        options = []
-        remaining_args = []
-        
-        for arg in args:
-            if arg.startswith('-') and len(arg) > 1:
-                options.append(arg)
-            else:
-                remaining_args.append(arg)
-        
-        return options, remaining_args
-    
-    def expand_wildcards(self, pattern: str, current_dir: str) -> List[str]:
-        """
-        Expand shell wildcards like * and ?.
-        
-        Args:
-            pattern: Pattern with potential wildcards
-            current_dir: Current directory path
-            
-        Returns:
-            List of expanded filenames
-        """
-        import glob
-        import os
-        
-        if '*' in pattern or '?' in pattern or '[' in pattern:
-            # Handle absolute vs relative paths
-            if os.path.isabs(pattern):
-                matches = glob.glob(pattern)
-            else:
-                full_pattern = os.path.join(current_dir, pattern)
-                matches = glob.glob(full_pattern)
-                # Convert back to relative paths if original was relative
-                matches = [os.path.relpath(match, current_dir) for match in matches]
-            
-            return sorted(matches) if matches else [pattern]
-        else:
-            return [pattern]
-    
-    def parse_redirections(self, args: List[str]) -> Tuple[List[str], Optional[str], Optional[str], bool]:
+        self._root = {}
+        self._frozen = False
+
+    def insert(self, name: str, handler) -> None:
+        """Register a command name with its handler."""
+        if self._frozen:
+            raise ValueError("cannot insert into a frozen trie")
+        node = self._root
+        for char in name:
+            node = node.setdefault(char, {})
+        node[self._END] = handler
+
+    def freeze(self) -> None:
+        """Mark the trie read-only once all commands are registered."""
+        self._frozen = True
+
+    def _walk(self, prefix: str):
+        node = self._root
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def get(self, name: str):
+        """Return the handler for an exact command name, or None."""
+        node = self._walk(name)
+        return node.get(self._END) if node is not None else None
+
+    def longest_prefix_match(self, line: str):
         """
-        Parse output redirections (>, >>, <).
-        
-        Args:
-            args: Command arguments
-            
-        Returns:
-            Tuple of (cleaned_args, output_file, input_file, append_mode)
+        Return (name, handler) for the longest registered command that
+        prefixes the line, or None if no command matches.
         """
-        cleaned_args = []
-        output_file = None
-        input_file = None
-        append_mode = False
-        
-        i = 0
-        while i < len(args):
-            arg = args[i]
-            
-            if arg == '>':
-                # Output redirection
-                if i + 1 < len(args):
-                    output_file = args[i + 1]
-                    i += 2
+        node = self._root
+        best = None
+        for i, char in enumerate(line):
+            node = node.get(char)
+            if node is None:
+                break
+            if self._END in node:
+                best = (line[:i + 1], node[self._END])
+        return best
+
+    def completions(self, prefix: str) -> List[str]:
+        """Return all registered command names starting with the prefix."""
+        node = self._walk(prefix)
+        if node is None:
+            return []
+
+        results = []
+        stack = [(prefix, node)]
+        while stack:
+            text, current = stack.pop()
+            for char, child in current.items():
+                if char == self._END:
+                    results.append(text)
                 else:
-                    cleaned_args.append(arg)
-                    i += 1
-            elif arg == '>>':
-                # Append redirection
-                if i + 1 < len(args):
+                    stack.append((text + char, child))
+        return sorted(results)
+
+
+def parse_command(command_line: str,
+                  trie: Optional[CommandTrie] = None) -> Tuple[object, Tuple[str, ...]]:
+    """
+    Parse a command line into command and arguments.
+
+    The arguments come back as a tuple: exactly sized, hashable for
+    downstream memoization, and shareable straight out of the parse
+    cache without a defensive copy.
+
+    Args:
+        command_line: The raw command line string
+        trie: Optional CommandTrie; when given and the command is
+            registered, its handler is returned in place of the name
+
+    Returns:
+        Tuple of (command_or_handler, arguments_tuple)
+    """
+    command_line = command_line.strip()
+
+    if not command_line:
+        return "", ()
+
+    command, args = _parse_cached(command_line)
+
+    if trie is not None:
+        handler = trie.get(command)
+        if handler is not None:
+            return handler, args
+
+    return command, args
+
+
+def parse_many(lines) -> List[Tuple[object, Tuple[str, ...]]]:
+    """
+    Parse a batch of command lines in one call (history replay,
+    scripted input).
+
+    A single comprehension keeps the loop in C-level bytecode dispatch
+    instead of a caller-side Python loop, and every line shares the
+    parse cache, so repeated lines in a batch tokenize only once.
+
+    Args:
+        lines: Iterable of raw command line strings
+
+    Returns:
+        List of (command, arguments_tuple) pairs, one per input line
+    """
+    return [parse_command(line) for line in lines]
+
+
+def clear_cache() -> None:
+    """
+    Clear the memoized parse and path results (e.g. after alias
+    changes or a $HOME update).
+    """
+    _parse_cached.cache_clear()
+    _normalize_path.cache_clear()
+
+
+def parse_options(args: List[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Separate options (starting with -) from regular arguments.
+
+    Args:
+        args: List of command arguments
+
+    Returns:
+        Tuple of (options, remaining_args), both tuples
+    """
+    # Classify each argument once, then build both lists with C-level
+    # comprehension appends; a[0] == '-' avoids the startswith method
+    # call and len(a) > 1 lets a lone '-' (stdin) stay positional
+    mask = [len(arg) > 1 and arg[0] == '-' for arg in args]
+
+    # Flags like -l/-la repeat endlessly in a session; intern them to
+    # collapse duplicate allocations
+    options = tuple(sys.intern(arg) for arg, is_opt in zip(args, mask) if is_opt)
+    remaining_args = tuple(arg for arg, is_opt in zip(args, mask) if not is_opt)
+
+    return options, remaining_args
+
+
+def expand_wildcards(pattern: str, current_dir: str) -> List[str]:
+    """
+    Expand shell wildcards like * and ?.
+
+    Args:
+        pattern: Pattern with potential wildcards
+        current_dir: Current directory path
+
+    Returns:
+        List of expanded filenames
+    """
+    if _WILDCARD_RE.search(pattern):
+        # Handle absolute vs relative paths
+        if os.path.isabs(pattern):
+            matches = sorted(glob.iglob(pattern))
+        elif sys.version_info >= (3, 10):
+            # root_dir makes glob return paths already relative to the
+            # current directory, avoiding a relpath rewrite per match
+            matches = sorted(glob.iglob(pattern, root_dir=current_dir))
+        else:
+            full_pattern = os.path.join(current_dir, pattern)
+            matches = glob.glob(full_pattern)
+            # Convert back to relative paths if original was relative
+            matches = sorted(os.path.relpath(match, current_dir) for match in matches)
+
+        return matches if matches else [pattern]
+    else:
+        return [pattern]
+
+
+def parse_redirections(args: List[str]) -> Tuple[List[str], Optional[str], Optional[str], bool]:
+    """
+    Parse output redirections (>, >>, <).
+
+    Args:
+        args: Command arguments
+
+    Returns:
+        Tuple of (cleaned_args, output_file, input_file, append_mode)
+    """
+    # Preallocate at the maximum possible size and fill via a write
+    # cursor, so the list never reallocates mid-loop
+    n = len(args)
+    cleaned_args = [None] * n
+    w = 0
+    output_file = None
+    input_file = None
+    append_mode = False
+
+    i = 0
+    while i < n:
+        arg = args[i]
+
+        # Single dict lookup replaces the chain of operator comparisons;
+        # the common non-redirection argument costs one dict miss
+        spec = _REDIR_TWO_ARG.get(arg)
+        if spec is not None:
+            if i + 1 < n:
+                field, append = spec
+                if field == 'output':
                     output_file = args[i + 1]
-                    append_mode = True
-                    i += 2
+                    append_mode = append
                 else:
-                    cleaned_args.append(arg)
-                    i += 1
-            elif arg == '<':
-                # Input redirection
-                if i + 1 < len(args):
                     input_file = args[i + 1]
-                    i += 2
-                else:
-                    cleaned_args.append(arg)
-                    i += 1
-            elif arg.startswith('>'):
-                # Combined redirection like >file
-                if len(arg) > 1:
-                    if arg.startswith('>>'):
-                        output_file = arg[2:]
-                        append_mode = True
-                    else:
-                        output_file = arg[1:]
-                else:
-                    cleaned_args.append(arg)
-                i += 1
+                i += 2
             else:
-                cleaned_args.append(arg)
+                cleaned_args[w] = arg
+                w += 1
                 i += 1
-        
-        return cleaned_args, output_file, input_file, append_mode
-    
-    def is_background_command(self, command_line: str) -> Tuple[str, bool]:
-        """
-        Check if command should run in background (ends with &).
-        
-        Args:
-            command_line: The command line string
-            
-        Returns:
-            Tuple of (cleaned_command_line, is_background)
-        """
-        command_line = command_line.strip()
-        
-        if command_line.endswith('&'):
-            return command_line[:-1].strip(), True
         else:
-            return command_line, False
-    
-    def split_pipeline(self, command_line: str) -> List[str]:
-        """
-        Split command line by pipes (|) for pipeline processing.
-        
-        Args:
-            command_line: The command line string
-            
-        Returns:
-            List of individual commands in the pipeline
-        """
-        # Simple pipe splitting - doesn't handle quotes properly
-        # This is a simplified version
-        if '|' not in command_line:
-            return [command_line]
-        
-        commands = []
-        current_cmd = ""
-        in_quotes = False
-        quote_char = None
-        
-        for char in command_line:
-            if char in ['"', "'"] and not in_quotes:
-                in_quotes = True
-                quote_char = char
-                current_cmd += char
-            elif char == quote_char and in_quotes:
-                in_quotes = False
-                quote_char = None
-                current_cmd += char
-            elif char == '|' and not in_quotes:
-                commands.append(current_cmd.strip())
-                current_cmd = ""
+            match = _INLINE_REDIR.match(arg)
+            if match:
+                # Combined redirection like >file, >>file or <file
+                op, name = match.groups()
+                if op == '>>':
+                    output_file = name
+                    append_mode = True
+                elif op == '>':
+                    output_file = name
+                else:
+                    input_file = name
             else:
-                current_cmd += char
-        
-        if current_cmd.strip():
-            commands.append(current_cmd.strip())
-        
-        return commands
-    
-    def normalize_path(self, path: str, current_dir: str) -> str:
-        """
-        Normalize a file path, handling ~ and relative paths.
-        
-        Args:
-            path: The path to normalize
-            current_dir: Current directory
-            
-        Returns:
-            Normalized absolute path
-        """
-        import os
-        
-        if path.startswith('~'):
-            path = os.path.expanduser(path)
-        
-        if not os.path.isabs(path):
-            path = os.path.join(current_dir, path)
-        
-        return os.path.normpath(path)
\ No newline at end of file
+                cleaned_args[w] = arg
+                w += 1
+            i += 1
+
+    del cleaned_args[w:]
+    return cleaned_args, output_file, input_file, append_mode
+
+
+def is_background_command(command_line: str) -> Tuple[str, bool]:
+    """
+    Check if command should run in background (ends with &).
+
+    Args:
+        command_line: The command line string
+
+    Returns:
+        Tuple of (cleaned_command_line, is_background)
+    """
+    # One strip pass; only the trailing-& case pays for a second rstrip
+    # to drop whitespace between the command and the ampersand
+    command_line = command_line.strip()
+
+    if command_line and command_line[-1] == '&':
+        return command_line[:-1].rstrip(), True
+    else:
+        return command_line, False
+
+
+def split_pipeline(command_line: str) -> List[str]:
+    """
+    Split command line by pipes (|) for pipeline processing.
+
+    Args:
+        command_line: The command line string
+
+    Returns:
+        List of individual commands in the pipeline
+    """
+    # Simple pipe splitting - doesn't handle quotes properly
+    # This is a simplified version
+    if '|' not in command_line:
+        return [command_line]
+
+    # Drive the precomputed DFA table: one lookup per character instead
+    # of the quote/pipe branch chain. Non-ASCII characters can only
+    # appear inside arguments, so they keep the current state.
+    # The pipe count bounds the segment count, so preallocating means
+    # the result list never reallocates during the scan.
+    commands = [None] * (command_line.count('|') + 1)
+    w = 0
+    start = 0
+    state = _ST_DEFAULT
+    transitions = _TRANSITIONS
+
+    for i, char in enumerate(command_line):
+        code = ord(char)
+        if code < 256:
+            state = transitions[state][code]
+            if state == _ST_SPLIT:
+                commands[w] = command_line[start:i].strip()
+                w += 1
+                start = i + 1
+                state = _ST_DEFAULT
+
+    tail = command_line[start:].strip()
+    if tail:
+        commands[w] = tail
+        w += 1
+
+    del commands[w:]
+    return commands
+
+
+def normalize_path(path: str, current_dir: str) -> str:
+    """
+    Normalize a file path, handling ~ and relative paths.
+
+    Args:
+        path: The path to normalize
+        current_dir: Current directory
+
+    Returns:
+        Normalized absolute path
+    """
+    return _normalize_path(path, current_dir)
+
+
+class CommandParser:
+    """
+    Stateless facade over the module-level parsing functions, kept for
+    callers that construct a parser object.
+    """
+
+    # No per-instance state: skip the __dict__ entirely
+    __slots__ = ()
+
+    parse_command = staticmethod(parse_command)
+    parse_many = staticmethod(parse_many)
+    clear_cache = staticmethod(clear_cache)
+    parse_options = staticmethod(parse_options)
+    expand_wildcards = staticmethod(expand_wildcards)
+    parse_redirections = staticmethod(parse_redirections)
+    is_background_command = staticmethod(is_background_command)
+    split_pipeline = staticmethod(split_pipeline)
+    normalize_path = staticmethod(normalize_path)
@@ -4,11 +4,56 @@ System Monitor
 This module handles system monitoring commands like ps, top, free, df, etc.
 """
 
+import getpass
+import heapq
+import platform
 import psutil
 import os
 import time
-from typing import List, Tuple, Dict, Any
-from tabulate import tabulate
+from typing import FrozenSet, List, Tuple, Dict, Any
+
+# Signal names accepted by kill's -NAME form
+_SIGNAL_NAMES = {'TERM': 15, 'KILL': 9, 'HUP': 1, 'INT': 2, 'QUIT': 3, 'USR1': 10, 'USR2': 12}
+
+# Bare ps flag words that mean "all processes, user-oriented output"
+_PS_ALL_USER_FLAGS = frozenset(('aux', 'axu'))
+
+# How long a primed CPU sample stays fresh enough to reuse (seconds)
+_CPU_SAMPLE_REUSE = 5.0
+
+_KILL_USAGE = "kill: usage: kill [-s sigspec | -n signum | -sigspec] pid | jobspec ... or kill -l [sigspec]"
+_KILLALL_USAGE = "killall: usage: killall [-s signal] process_name"
+
+
+def _render_plain(headers: List[str], rows: List[List[Any]]) -> str:
+    """
+    Render a table in tabulate's 'plain' style without the library:
+    one width pass, two-space gutters, numeric columns right-aligned.
+    """
+    widths = [len(h) for h in headers]
+    numeric = [True] * len(headers)
+    str_rows = []
+    for row in rows:
+        cells = []
+        for i, cell in enumerate(row):
+            if isinstance(cell, str):
+                numeric[i] = False
+            elif isinstance(cell, float):
+                cell = f"{cell:.1f}"
+            else:
+                cell = str(cell)
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+            cells.append(cell)
+        str_rows.append(cells)
+
+    fmt = "  ".join(
+        f"{{:>{w}}}" if num else f"{{:<{w}}}"
+        for w, num in zip(widths, numeric)
+    )
+    lines = [fmt.format(*headers).rstrip()]
+    lines.extend(fmt.format(*cells).rstrip() for cells in str_rows)
+    return "\n".join(lines)
 
 
 class SystemMonitor:
@@ -31,10 +76,44 @@ class SystemMonitor:
             'whoami': self._handle_whoami,
             'uname': self._handle_uname,
         }
-    
-    def get_supported_commands(self) -> List[str]:
-        """Get list of supported system monitoring commands."""
-        return list(self.supported_commands.keys())
+        self._supported = frozenset(self.supported_commands)
+
+        # Process-lifetime constants, resolved once instead of per command
+        self._uname = platform.uname()
+        self._boot_time = psutil.boot_time()
+        try:
+            self._username = getpass.getuser()
+        except Exception:
+            self._username = None
+
+        # Monotonic timestamp of the last primed CPU sample (see _prime_cpu)
+        self._cpu_primed_at = 0.0
+
+    def _prime_cpu(self, procs) -> None:
+        """
+        Establish a CPU measurement window for the given processes.
+
+        A non-blocking cpu_percent call only records a baseline, so a
+        fresh prime needs a short settle sleep before reads mean anything.
+        psutil keeps those baselines per process, so if ps/top ran within
+        the reuse window the time elapsed since then already serves as
+        the measurement window and both the prime pass and the sleep are
+        skipped.
+        """
+        now = time.monotonic()
+        if now - self._cpu_primed_at < _CPU_SAMPLE_REUSE:
+            return
+        for proc in procs:
+            try:
+                proc.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+        time.sleep(0.1)
+        self._cpu_primed_at = time.monotonic()
+
+    def get_supported_commands(self) -> FrozenSet[str]:
+        """Get the supported system monitoring commands as a frozenset."""
+        return self._supported
     
     def execute_command(self, command: str, args: List[str]) -> Tuple[str, int]:
         """
@@ -72,31 +151,46 @@ class SystemMonitor:
                     show_all = True
                 if 'f' in arg:
                     show_full = True
-            elif arg in ['aux', 'axu']:
+            elif arg in _PS_ALL_USER_FLAGS:
                 show_all = True
                 show_user = True
         
+        # Pick the column layout up front so the scan below can emit table
+        # rows directly instead of building per-process dicts first
+        if show_user:
+            headers = ['USER', 'PID', 'PPID', '%CPU', '%MEM', 'STAT', 'TIME', 'COMMAND']
+        else:
+            headers = ['PID', 'PPID', 'STAT', 'TIME', 'COMMAND']
+
         try:
             processes = []
-            
-            for proc in psutil.process_iter(['pid', 'ppid', 'name', 'username', 'status', 'cpu_percent', 'memory_percent', 'create_time', 'cmdline']):
+
+            # Resolved once; the per-process loop only compares against it
+            current_user = psutil.Process().username()
+
+            # One shared measurement window for all processes instead of
+            # a 0.1s blocking interval per process
+            procs = list(psutil.process_iter(['pid', 'ppid', 'name', 'username', 'status', 'memory_percent', 'create_time', 'cmdline']))
+            self._prime_cpu(procs)
+
+            for proc in procs:
                 try:
                     pinfo = proc.info
-                    
+
                     # Filter processes based on options
                     if not show_all:
                         # Only show processes from the current user and with a controlling terminal
-                        if pinfo['username'] != psutil.Process().username():
+                        if pinfo['username'] != current_user:
                             continue
-                    
+
                     # Calculate CPU and memory usage
                     try:
-                        cpu_percent = proc.cpu_percent(interval=0.1)
+                        cpu_percent = proc.cpu_percent(interval=None)
                         memory_percent = proc.memory_percent()
                     except (psutil.NoSuchProcess, psutil.AccessDenied):
                         cpu_percent = 0.0
                         memory_percent = 0.0
-                    
+
                     # Format command
                     if show_full and pinfo['cmdline']:
                         command = ' '.join(pinfo['cmdline'])
@@ -112,35 +206,27 @@ class SystemMonitor:
                     else:
                         start_time = "?"
                     
-                    process_data = {
-                        'PID': pinfo['pid'],
-                        'PPID': pinfo['ppid'] or 0,
-                        'USER': pinfo['username'] or '?',
-                        'STAT': pinfo['status'] or '?',
-                        '%CPU': f"{cpu_percent:.1f}",
-                        '%MEM': f"{memory_percent:.1f}",
-                        'TIME': start_time,
-                        'COMMAND': command
-                    }
-                    
-                    processes.append(process_data)
-                    
+                    pid = pinfo['pid']
+                    ppid = pinfo['ppid'] or 0
+                    stat_str = pinfo['status'] or '?'
+                    if show_user:
+                        # %CPU/%MEM stay floats; the renderer formats them
+                        row = [pinfo['username'] or '?', pid, ppid,
+                               cpu_percent, memory_percent,
+                               stat_str, start_time, command]
+                    else:
+                        row = [pid, ppid, stat_str, start_time, command]
+
+                    processes.append((pid, row))
+
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     # Process may have terminated or we don't have access
                     pass
-            
+
             # Sort by PID
-            processes.sort(key=lambda x: x['PID'])
-            
-            # Format output
-            if show_user:
-                headers = ['USER', 'PID', 'PPID', '%CPU', '%MEM', 'STAT', 'TIME', 'COMMAND']
-                table_data = [[p[h] for h in headers] for p in processes]
-            else:
-                headers = ['PID', 'PPID', 'STAT', 'TIME', 'COMMAND']
-                table_data = [[p[h] for h in headers] for p in processes]
-            
-            output = tabulate(table_data, headers=headers, tablefmt='plain')
+            processes.sort(key=lambda x: x[0])
+
+            output = _render_plain(headers, [row for _, row in processes])
             return output, 0
             
         except Exception as e:
@@ -163,34 +249,36 @@ class SystemMonitor:
             
             # Process table
             processes = []
-            
-            for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status']):
+
+            # Prime CPU counters once, share a single measurement window
+            procs = list(psutil.process_iter(['pid', 'name', 'username', 'memory_percent', 'status']))
+            self._prime_cpu(procs)
+
+            for proc in procs:
                 try:
                     pinfo = proc.info
-                    cpu_percent = proc.cpu_percent(interval=0.1)
-                    
-                    processes.append({
-                        'PID': pinfo['pid'],
-                        'USER': (pinfo['username'] or '?')[:10],
-                        'CPU%': f"{cpu_percent:.1f}",
-                        'MEM%': f"{pinfo['memory_percent']:.1f}",
-                        'STAT': pinfo['status'] or '?',
-                        'COMMAND': (pinfo['name'] or '?')[:20]
-                    })
-                    
+                    cpu_percent = proc.cpu_percent(interval=None)
+
+                    # Emit table rows directly; the leading cpu float is the
+                    # sort key and never reaches the rendered output
+                    processes.append((cpu_percent, [
+                        pinfo['pid'],
+                        (pinfo['username'] or '?')[:10],
+                        cpu_percent,
+                        pinfo['memory_percent'] or 0.0,
+                        pinfo['status'] or '?',
+                        (pinfo['name'] or '?')[:20],
+                    ]))
+
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     pass
-            
-            # Sort by CPU usage (descending)
-            processes.sort(key=lambda x: float(x['CPU%']), reverse=True)
-            
-            # Take top 20 processes
-            processes = processes[:20]
-            
+
+            # Top 20 by CPU usage; a bounded heap selection beats sorting
+            # the full process list just to keep its head
+            top_procs = heapq.nlargest(20, processes, key=lambda x: x[0])
+
             headers = ['PID', 'USER', 'CPU%', 'MEM%', 'STAT', 'COMMAND']
-            table_data = [[p[h] for h in headers] for p in processes]
-            
-            output_lines.append(tabulate(table_data, headers=headers, tablefmt='plain'))
+            output_lines.append(_render_plain(headers, [row for _, row in top_procs]))
             
             return "\n".join(output_lines), 0
             
@@ -228,7 +316,7 @@ class SystemMonitor:
                 ['Swap:', total_swap, used_swap, free_swap]
             ]
             
-            output = tabulate(data, headers=headers, tablefmt='plain')
+            output = _render_plain(headers, data)
             return output, 0
             
         except Exception as e:
@@ -275,7 +363,7 @@ class SystemMonitor:
                     pass
             
             headers = ['Filesystem', 'Size', 'Used', 'Available', 'Use%', 'Mounted on']
-            output = tabulate(data, headers=headers, tablefmt='plain')
+            output = _render_plain(headers, data)
             return output, 0
             
         except Exception as e:
@@ -284,9 +372,8 @@ class SystemMonitor:
     def _handle_uptime(self, args: List[str]) -> Tuple[str, int]:
         """Handle uptime command."""
         try:
-            boot_time = psutil.boot_time()
             current_time = time.time()
-            uptime_seconds = current_time - boot_time
+            uptime_seconds = current_time - self._boot_time
             
             # Convert to days, hours, minutes
             days = int(uptime_seconds // 86400)
@@ -303,15 +390,19 @@ class SystemMonitor:
             except (OSError, AttributeError):
                 load_str = ""
             
-            # Number of users (simplified - just count unique usernames of running processes)
-            users = set()
-            for proc in psutil.process_iter(['username']):
-                try:
-                    if proc.info['username']:
-                        users.add(proc.info['username'])
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
-            user_count = len(users)
+            # Number of users: ask the utmp-backed session list first, and
+            # only fall back to scanning process owners when nothing is
+            # logged in (e.g. containers without login sessions)
+            user_count = len({u.name for u in psutil.users()})
+            if user_count == 0:
+                users = set()
+                for proc in psutil.process_iter(['username']):
+                    try:
+                        if proc.info['username']:
+                            users.add(proc.info['username'])
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        pass
+                user_count = len(users)
             
             if days > 0:
                 uptime_str = f"{days} day{'s' if days != 1 else ''}, {hours:02d}:{minutes:02d}"
@@ -327,7 +418,7 @@ class SystemMonitor:
     def _handle_kill(self, args: List[str]) -> Tuple[str, int]:
         """Handle kill command."""
         if not args:
-            return "kill: usage: kill [-s sigspec | -n signum | -sigspec] pid | jobspec ... or kill -l [sigspec]", 1
+            return _KILL_USAGE, 1
         
         signal_num = 15  # SIGTERM by default
         pids = []
@@ -341,9 +432,7 @@ class SystemMonitor:
                         signal_num = int(arg[1:])
                     else:
                         # Handle signal names like -TERM, -KILL, etc.
-                        signal_names = {'TERM': 15, 'KILL': 9, 'HUP': 1, 'INT': 2, 'QUIT': 3, 'USR1': 10, 'USR2': 12}
-                        signal_name = arg[1:].upper()
-                        signal_num = signal_names.get(signal_name, 15)
+                        signal_num = _SIGNAL_NAMES.get(arg[1:].upper(), 15)
                 except ValueError:
                     return f"kill: invalid signal specification '{arg}'", 1
             else:
@@ -354,7 +443,7 @@ class SystemMonitor:
             i += 1
         
         if not pids:
-            return "kill: usage: kill [-s sigspec | -n signum | -sigspec] pid | jobspec ... or kill -l [sigspec]", 1
+            return _KILL_USAGE, 1
         
         errors = []
         for pid in pids:
@@ -376,7 +465,7 @@ class SystemMonitor:
     def _handle_killall(self, args: List[str]) -> Tuple[str, int]:
         """Handle killall command."""
         if not args:
-            return "killall: usage: killall [-s signal] process_name", 1
+            return _KILLALL_USAGE, 1
         
         signal_num = 15  # SIGTERM by default
         process_names = []
@@ -394,19 +483,20 @@ class SystemMonitor:
                 i += 1
         
         if not process_names:
-            return "killall: usage: killall [-s signal] process_name", 1
+            return _KILLALL_USAGE, 1
         
         killed_count = 0
         errors = []
         
-        for process_name in process_names:
-            for proc in psutil.process_iter(['pid', 'name']):
-                try:
-                    if proc.info['name'] == process_name:
-                        proc.send_signal(signal_num)
-                        killed_count += 1
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    pass
+        # One scan of the process table, matched against all target names
+        targets = frozenset(process_names)
+        for proc in psutil.process_iter():
+            try:
+                if proc.name() in targets:
+                    proc.send_signal(signal_num)
+                    killed_count += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
         
         if killed_count == 0:
             return f"killall: no process found", 1
@@ -429,7 +519,7 @@ class SystemMonitor:
                 started = time.strftime('%Y-%m-%d %H:%M', time.localtime(user.started))
                 data.append([user.name, user.terminal or 'console', started])
             
-            output = tabulate(data, headers=['USER', 'TTY', 'LOGIN'], tablefmt='plain')
+            output = _render_plain(['USER', 'TTY', 'LOGIN'], data)
             return output, 0
             
         except Exception as e:
@@ -437,16 +527,12 @@ class SystemMonitor:
     
     def _handle_whoami(self, args: List[str]) -> Tuple[str, int]:
         """Handle whoami command."""
-        try:
-            import getpass
-            return getpass.getuser(), 0
-        except Exception as e:
-            return f"whoami: {str(e)}", 1
-    
+        if self._username is None:
+            return "whoami: cannot determine current user", 1
+        return self._username, 0
+
     def _handle_uname(self, args: List[str]) -> Tuple[str, int]:
         """Handle uname command."""
-        import platform
-        
         show_all = '-a' in args
         show_system = '-s' in args or not args or show_all
         show_node = '-n' in args or show_all
@@ -457,22 +543,22 @@ class SystemMonitor:
         parts = []
         
         if show_system:
-            parts.append(platform.system())
+            parts.append(self._uname.system)
         if show_node:
-            parts.append(platform.node())
+            parts.append(self._uname.node)
         if show_release:
-            parts.append(platform.release())
+            parts.append(self._uname.release)
         if show_version:
-            parts.append(platform.version())
+            parts.append(self._uname.version)
         if show_machine:
-            parts.append(platform.machine())
+            parts.append(self._uname.machine)
         
         return " ".join(parts), 0
     
     def _format_bytes(self, bytes_val: int) -> str:
         """Format bytes in human-readable format."""
-        for unit in ['B', 'K', 'M', 'G', 'T']:
-            if bytes_val < 1024.0:
-                return f"{bytes_val:.1f}{unit}"
-            bytes_val /= 1024.0
-        return f"{bytes_val:.1f}P"
\ No newline at end of file
+        if bytes_val <= 0:
+            return "0.0B"
+        # bit_length picks the unit directly instead of dividing in a loop
+        i = min((bytes_val.bit_length() - 1) // 10, 5)
+        return f"{bytes_val / (1 << (i * 10)):.1f}{'BKMGTP'[i]}"
\ No newline at end of file
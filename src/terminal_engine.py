@@ -1,7 +1,11 @@
 import os
+import stat
+import subprocess
 import sys
 import shlex
-from typing import Dict, List, Tuple, Optional, Any
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Tuple, Optional, Any
 from .command_parser import CommandParser
 from .file_operations import FileOperations
 from .system_monitor import SystemMonitor
@@ -10,6 +14,66 @@ from .utils.error_handler import ErrorHandler
 from .utils.formatter import OutputFormatter
 
 
+class TerminalExitRequested(Exception):
+    """Raised by exit/quit so the REPL can stop without polling is_running()."""
+    pass
+
+
+# Static help text, built once at import instead of per help invocation
+_HELP_TEXT = """
+Available Commands:
+==================
+
+Built-in Commands:
+  exit, quit    - Exit the terminal
+  help          - Show this help message
+  history       - Show command history
+  clear         - Clear the screen
+  cd <dir>      - Change directory
+  pwd           - Print working directory
+
+File Operations:
+  ls [options] [path]     - List directory contents
+  mkdir <dir>             - Create directory
+  rmdir <dir>             - Remove empty directory
+  rm <file/dir>           - Remove file or directory
+  cp <src> <dest>         - Copy file or directory
+  mv <src> <dest>         - Move/rename file or directory
+  cat <file>              - Display file contents
+  touch <file>            - Create empty file
+  find <path> <name>      - Find files/directories
+
+System Monitoring:
+  ps [options]            - List running processes
+  top                     - Show system processes (snapshot)
+  df [path]               - Show disk space usage
+  free                    - Show memory usage
+  uptime                  - Show system uptime
+
+AI Commands:
+  ai <query>        - Process natural language query
+  ask <query>       - Same as 'ai'
+  ai examples       - Show natural language examples
+
+System Commands:
+  Any other command will be passed to the system shell.
+
+Examples:
+  ls -la
+  mkdir new_folder
+  cp file1.txt backup/
+  ps aux
+  find . *.py
+
+Natural Language Examples:
+  "show me the files in this directory"
+  "create a new folder called projects"
+  "copy file.txt to backup folder"
+  "find all python files"
+  "what processes are running"
+        """
+
+
 class TerminalEngine:
     """
     Main terminal engine that handles command execution and coordination
@@ -25,7 +89,8 @@ class TerminalEngine:
         self.ai_processor = AIProcessor()
         self.error_handler = ErrorHandler()
         self.formatter = OutputFormatter()
-        self.command_history: List[str] = []
+        # Bounded so long-lived sessions don't grow history without limit
+        self.command_history: Deque[str] = deque(maxlen=10000)
         self.running = True
         
         # Built-in commands that are handled by the terminal engine
@@ -40,6 +105,12 @@ class TerminalEngine:
             'ai': self._handle_ai,
             'ask': self._handle_ai,
         }
+
+        # Command sets are fixed after construction; cache them so the
+        # per-command dispatch below is three set probes, not list rebuilds
+        self._file_commands = self.file_ops.get_supported_commands()
+        self._monitor_commands = self.system_monitor.get_supported_commands()
+        self._known_commands = frozenset(self.builtin_commands) | self._file_commands | self._monitor_commands
     
     def execute_command(self, command_line: str) -> Tuple[str, int]:
         """
@@ -58,12 +129,18 @@ class TerminalEngine:
         self.command_history.append(command_line)
         
         try:
-            # First, check if this looks like a natural language query
-            if self.ai_processor.is_natural_language_query(command_line):
+            # A line whose first token is a known command can never be a
+            # natural language query, so skip the classifier for those
+            first_token = command_line.split(None, 1)[0]
+            if first_token not in self._known_commands and \
+                    self.ai_processor.is_natural_language_query(command_line):
                 ai_command = self.ai_processor.process_query(command_line)
                 if ai_command:
-                    # Execute the AI-generated command
-                    return self.execute_command(ai_command)
+                    # Dispatch the AI-generated command directly; re-entering
+                    # execute_command would append it to history a second
+                    # time and re-run the natural language check on it
+                    command, args = self.command_parser.parse_command(ai_command)
+                    return self._dispatch_parsed(command, args)
                 else:
                     # Provide suggestions if AI couldn't process the query
                     suggestions = self.ai_processor.get_suggestions(command_line)
@@ -73,35 +150,44 @@ class TerminalEngine:
                     else:
                         return "I couldn't understand that command. Type 'help' for available commands or 'ai examples' for natural language examples.", 1
             
-            # Parse the command
+            # Parse the command and dispatch it
             command, args = self.command_parser.parse_command(command_line)
-            
-            # Check if it's a built-in command
-            if command in self.builtin_commands:
-                return self.builtin_commands[command](args)
-            
-            # Check if it's a file operation
-            elif command in self.file_ops.get_supported_commands():
-                return self.file_ops.execute_command(command, args, self.current_directory)
-            
-            # Check if it's a system monitoring command
-            elif command in self.system_monitor.get_supported_commands():
-                return self.system_monitor.execute_command(command, args)
-            
-            # Try to execute as a system command
-            else:
-                return self._execute_system_command(command, args)
-                
+            return self._dispatch_parsed(command, args)
+
+        except TerminalExitRequested:
+            raise
         except Exception as e:
+            # Materialize the lazy message here: this method's contract is
+            # Tuple[str, int] and callers treat the output as a plain
+            # string (len, slicing). Deferred formatting still pays off
+            # inside the handler, where log_error may suppress the message.
             error_msg = self.error_handler.handle_error(e, command_line)
-            return error_msg, 1
-    
+            return str(error_msg), 1
+
+    def _dispatch_parsed(self, command: str, args: List[str]) -> Tuple[str, int]:
+        """Route an already-parsed command to the module that handles it."""
+        # Check if it's a built-in command
+        if command in self.builtin_commands:
+            return self.builtin_commands[command](args)
+
+        # Check if it's a file operation
+        elif command in self._file_commands:
+            return self.file_ops.execute_command(command, args, self.current_directory)
+
+        # Check if it's a system monitoring command
+        elif command in self._monitor_commands:
+            return self.system_monitor.execute_command(command, args)
+
+        # Try to execute as a system command
+        else:
+            return self._execute_system_command(command, args)
+
     def _execute_system_command(self, command: str, args: List[str]) -> Tuple[str, int]:
         """Execute a system command using subprocess."""
-        import subprocess
-        
         try:
-            cmd_list = [command] + args
+            # args arrives as a tuple from the parse cache; unpack rather
+            # than concatenate
+            cmd_list = [command, *args]
             result = subprocess.run(
                 cmd_list,
                 capture_output=True,
@@ -110,11 +196,9 @@ class TerminalEngine:
                 timeout=30
             )
             
-            output = result.stdout
             if result.stderr:
-                output += f"\n{result.stderr}"
-            
-            return output, result.returncode
+                return "".join((result.stdout, "\n", result.stderr)), result.returncode
+            return result.stdout, result.returncode
             
         except subprocess.TimeoutExpired:
             return "Command timed out after 30 seconds", 1
@@ -126,73 +210,23 @@ class TerminalEngine:
     def _handle_exit(self, args: List[str]) -> Tuple[str, int]:
         """Handle exit command."""
         self.running = False
-        return "Goodbye!", 0
+        raise TerminalExitRequested("Goodbye!")
     
     def _handle_help(self, args: List[str]) -> Tuple[str, int]:
         """Handle help command."""
-        help_text = """
-Available Commands:
-==================
-
-Built-in Commands:
-  exit, quit    - Exit the terminal
-  help          - Show this help message
-  history       - Show command history
-  clear         - Clear the screen
-  cd <dir>      - Change directory
-  pwd           - Print working directory
-
-File Operations:
-  ls [options] [path]     - List directory contents
-  mkdir <dir>             - Create directory
-  rmdir <dir>             - Remove empty directory
-  rm <file/dir>           - Remove file or directory
-  cp <src> <dest>         - Copy file or directory
-  mv <src> <dest>         - Move/rename file or directory
-  cat <file>              - Display file contents
-  touch <file>            - Create empty file
-  find <path> <name>      - Find files/directories
-
-System Monitoring:
-  ps [options]            - List running processes
-  top                     - Show system processes (snapshot)
-  df [path]               - Show disk space usage
-  free                    - Show memory usage
-  uptime                  - Show system uptime
-
-AI Commands:
-  ai <query>        - Process natural language query
-  ask <query>       - Same as 'ai'
-  ai examples       - Show natural language examples
-
-System Commands:
-  Any other command will be passed to the system shell.
-
-Examples:
-  ls -la
-  mkdir new_folder
-  cp file1.txt backup/
-  ps aux
-  find . *.py
-
-Natural Language Examples:
-  "show me the files in this directory"
-  "create a new folder called projects"
-  "copy file.txt to backup folder"
-  "find all python files"
-  "what processes are running"
-        """
-        return help_text, 0
+        return _HELP_TEXT, 0
     
     def _handle_history(self, args: List[str]) -> Tuple[str, int]:
         """Handle history command."""
         if not self.command_history:
             return "No commands in history", 0
         
-        history_text = ""
-        for i, cmd in enumerate(self.command_history[-50:], 1):  # Show last 50 commands
-            history_text += f"{i:3d}  {cmd}\n"
-        
+        # Show last 50 commands; deques don't slice, so skip via islice
+        start = max(0, len(self.command_history) - 50)
+        history_text = "".join(
+            f"{i:3d}  {cmd}\n"
+            for i, cmd in enumerate(islice(self.command_history, start, None), 1)
+        )
         return history_text, 0
     
     def _handle_clear(self, args: List[str]) -> Tuple[str, int]:
@@ -220,17 +254,20 @@ Natural Language Examples:
             
             # Normalize the path
             target_dir = os.path.abspath(target_dir)
-            
-            if not os.path.exists(target_dir):
+
+            # One stat answers both "does it exist" and "is it a directory"
+            try:
+                st = os.stat(target_dir)
+            except FileNotFoundError:
                 return f"cd: no such file or directory: {args[0] if args else '~'}", 1
-            
-            if not os.path.isdir(target_dir):
+
+            if not stat.S_ISDIR(st.st_mode):
                 return f"cd: not a directory: {args[0] if args else '~'}", 1
-            
+
             self.current_directory = target_dir
             os.chdir(target_dir)  # Also change the actual working directory
             return "", 0
-            
+
         except PermissionError:
             return f"cd: permission denied: {args[0] if args else '~'}", 1
         except Exception as e:
@@ -260,7 +297,8 @@ Natural Language Examples:
         ai_command = self.ai_processor.process_query(query)
         if ai_command:
             output = f"Executing: {ai_command}\n"
-            result, exit_code = self.execute_command(ai_command)
+            command, cmd_args = self.command_parser.parse_command(ai_command)
+            result, exit_code = self._dispatch_parsed(command, cmd_args)
             return output + result, exit_code
         else:
             # Provide suggestions if AI couldn't process the query
@@ -271,6 +309,17 @@ Natural Language Examples:
             else:
                 return "I couldn't understand that query. Type 'ai examples' for example queries.", 1
     
+    def reset(self) -> None:
+        """Return the engine to a freshly-constructed state for reuse."""
+        home = os.path.expanduser("~")
+        try:
+            os.chdir(home)
+            self.current_directory = home
+        except OSError:
+            self.current_directory = os.getcwd()
+        self.command_history.clear()
+        self.running = True
+
     def get_current_directory(self) -> str:
         """Get the current working directory."""
         return self.current_directory
@@ -281,4 +330,4 @@ Natural Language Examples:
     
     def get_command_history(self) -> List[str]:
         """Get the command history."""
-        return self.command_history.copy()
\ No newline at end of file
+        return list(self.command_history)
\ No newline at end of file
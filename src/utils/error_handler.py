@@ -4,10 +4,159 @@ Error Handler
 This module provides centralized error handling for the terminal.
 """
 
+import functools
+import re
 import sys
 import traceback
 from typing import Any, Optional
 
+# Characters rejected by the validators. Paths use a frozenset scan (the
+# string spelling keeps the reported character deterministic); filenames
+# use a precompiled character class, which handles unicode input in one
+# C-level search and reports the leftmost offender.
+_INVALID_PATH_CHARS = '<>:"|?*'
+_INVALID_PATH_SET = frozenset(_INVALID_PATH_CHARS)
+_INVALID_FILENAME_RE = re.compile(r'[<>:"|?*\\/]')
+
+# Names that can never be created or removed
+_DOT_NAMES = frozenset(('.', '..'))
+
+# Commands that users might mistype, indexed once at import into a
+# BK-tree keyed by edit distance for typo suggestions
+_COMMON_COMMANDS = (
+    'ls', 'cd', 'pwd', 'mkdir', 'rmdir', 'rm', 'cp', 'mv', 'cat', 'touch',
+    'find', 'grep', 'head', 'tail', 'wc', 'chmod', 'chown', 'stat',
+    'ps', 'top', 'free', 'df', 'uptime', 'kill', 'killall', 'who', 'whoami',
+    'uname', 'history', 'help', 'clear', 'exit', 'quit',
+)
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """
+    Damerau-Levenshtein distance (optimal string alignment): insertions,
+    deletions, substitutions and adjacent transpositions all cost 1.
+
+    The DP runs over the shorter string's columns with the rows kept in
+    plain lists and the loop variables bound locally — the hot path of
+    every BK-tree probe, so the inner loop is kept as lean as pure
+    Python allows.
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    la, lb = len(a), len(b)
+    if lb == 0:
+        return la
+
+    prev2 = None
+    prev = list(range(lb + 1))
+    for i in range(1, la + 1):
+        ca = a[i - 1]
+        ca_prev = a[i - 2] if i > 1 else ''
+        cur = [i] + [0] * lb
+        left = i  # running cur[j - 1]
+        for j in range(1, lb + 1):
+            cb = b[j - 1]
+            if ca == cb:
+                # Matching chars: the diagonal is always optimal
+                best = prev[j - 1]
+            else:
+                best = prev[j - 1] + 1
+                up = prev[j] + 1
+                if up < best:
+                    best = up
+                ins = left + 1
+                if ins < best:
+                    best = ins
+                if j > 1 and ca == b[j - 2] and ca_prev == cb:
+                    trans = prev2[j - 2] + 1
+                    if trans < best:
+                        best = trans
+            cur[j] = best
+            left = best
+        prev2, prev = prev, cur
+    return prev[lb]
+
+
+def _build_bk_tree(terms):
+    """Build a BK-tree: each node is [term, {distance: child_node}]."""
+    it = iter(terms)
+    root = [next(it), {}]
+    for term in it:
+        node = root
+        while True:
+            d = _edit_distance(term, node[0])
+            if d == 0:
+                break
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [term, {}]
+                break
+            node = child
+    return root
+
+
+def _bk_query(root, term: str, max_dist: int):
+    """Collect (distance, term) pairs within max_dist of term."""
+    matches = []
+    stack = [root]
+    while stack:
+        word, children = stack.pop()
+        d = _edit_distance(term, word)
+        if d <= max_dist:
+            matches.append((d, word))
+        # The triangle inequality prunes children outside [d-k, d+k]
+        for child_dist, child in children.items():
+            if d - max_dist <= child_dist <= d + max_dist:
+                stack.append(child)
+    return matches
+
+
+_BK_TREE = _build_bk_tree(_COMMON_COMMANDS)
+
+
+def _build_prefix_buckets(terms):
+    """Bucket terms by their two-character prefix."""
+    buckets = {}
+    for term in terms:
+        buckets.setdefault(term[:2], []).append(term)
+    return {prefix: tuple(cmds) for prefix, cmds in buckets.items()}
+
+
+_BY_PREFIX = _build_prefix_buckets(_COMMON_COMMANDS)
+
+
+class _LazyErrorMessage:
+    """
+    Error message that formats itself on first str() and caches the result.
+
+    handle_error used to build its string eagerly even when the caller
+    discarded it (e.g. suppressed logging); deferring to __str__ makes a
+    dropped message cost nothing. Behaves like a string anywhere it is
+    printed, formatted or concatenated into an f-string.
+    """
+    __slots__ = ('exc', 'fmt', 'context', '_cached')
+
+    def __init__(self, exc: Exception, fmt: Optional[Any], context: str = ""):
+        self.exc = exc
+        self.fmt = fmt
+        self.context = context
+        self._cached = None
+
+    def __str__(self) -> str:
+        msg = self._cached
+        if msg is None:
+            error_msg = str(self.exc)
+            if self.fmt is not None:
+                msg = self.fmt(error_msg)
+            elif self.context:
+                msg = f"Error in {self.context}: {error_msg}"
+            else:
+                msg = f"Error: {error_msg}"
+            self._cached = msg
+        return msg
+
 
 class ErrorHandler:
     """
@@ -17,56 +166,70 @@ class ErrorHandler:
     def __init__(self, debug_mode: bool = False):
         """
         Initialize error handler.
-        
+
         Args:
             debug_mode: If True, show full tracebacks
         """
         self.debug_mode = debug_mode
+
+        # Exception type -> specialized formatter function. Looked up by
+        # exact type first; subclasses are resolved through the MRO once
+        # and memoized back into this dict (see handle_error). Each
+        # formatter is a closure with its prefix pre-bound, so applying
+        # it is one concatenation with no format-spec parsing.
+        self._formatters = {
+            exc_cls: self._make_formatter(prefix)
+            for exc_cls, prefix in (
+                (FileNotFoundError, "File or directory not found: "),
+                (PermissionError, "Permission denied: "),
+                (IsADirectoryError, "Is a directory: "),
+                (NotADirectoryError, "Not a directory: "),
+                (OSError, "System error: "),
+                (ValueError, "Invalid value: "),
+                (KeyError, "Key error: "),
+                (IndexError, "Index error: "),
+                (TypeError, "Type error: "),
+            )
+        }
+
+    @staticmethod
+    def _make_formatter(prefix: str):
+        """Build a formatter with the message prefix partially evaluated."""
+        def _format(msg: str, _prefix: str = prefix) -> str:
+            return _prefix + msg
+        return _format
     
-    def handle_error(self, exception: Exception, context: str = "") -> str:
+    def handle_error(self, exception: Exception, context: str = "") -> Any:
         """
         Handle an exception and return a formatted error message.
-        
+
         Args:
             exception: The exception that occurred
             context: Additional context about where the error occurred
-            
+
         Returns:
-            Formatted error message
+            The error message: a string in debug mode, otherwise a lazy
+            object that formats itself when str()'d (or printed)
         """
         if self.debug_mode:
             # In debug mode, show full traceback
             return f"Error: {str(exception)}\n{traceback.format_exc()}"
-        else:
-            # In normal mode, show user-friendly error message
-            error_type = type(exception).__name__
-            error_msg = str(exception)
-            
-            # Handle common exceptions with user-friendly messages
-            if isinstance(exception, FileNotFoundError):
-                return f"File or directory not found: {error_msg}"
-            elif isinstance(exception, PermissionError):
-                return f"Permission denied: {error_msg}"
-            elif isinstance(exception, IsADirectoryError):
-                return f"Is a directory: {error_msg}"
-            elif isinstance(exception, NotADirectoryError):
-                return f"Not a directory: {error_msg}"
-            elif isinstance(exception, OSError):
-                return f"System error: {error_msg}"
-            elif isinstance(exception, ValueError):
-                return f"Invalid value: {error_msg}"
-            elif isinstance(exception, KeyError):
-                return f"Key error: {error_msg}"
-            elif isinstance(exception, IndexError):
-                return f"Index error: {error_msg}"
-            elif isinstance(exception, TypeError):
-                return f"Type error: {error_msg}"
-            else:
-                # Generic error message
-                if context:
-                    return f"Error in {context}: {error_msg}"
-                else:
-                    return f"Error: {error_msg}"
+
+        # In normal mode, show a user-friendly message: one dict lookup
+        # replaces the old chain of isinstance checks
+        exc_type = type(exception)
+        fmt = self._formatters.get(exc_type)
+        if fmt is None:
+            # Subclass not seen before: walk the MRO for the nearest
+            # registered base and memoize the result for next time
+            for cls in exc_type.__mro__:
+                fmt = self._formatters.get(cls)
+                if fmt is not None:
+                    self._formatters[exc_type] = fmt
+                    break
+
+        # Defer the actual string building until the message is consumed
+        return _LazyErrorMessage(exception, fmt, context)
     
     def handle_command_not_found(self, command: str) -> str:
         """
@@ -202,12 +365,13 @@ class ErrorHandler:
         if len(path) > 4096:  # Typical max path length
             return "Path too long"
         
-        # Check for invalid characters (basic check)
-        invalid_chars = ['<', '>', ':', '"', '|', '?', '*']
-        for char in invalid_chars:
-            if char in path:
-                return f"Invalid character '{char}' in path"
-        
+        # Check for invalid characters (basic check); isdisjoint scans the
+        # whole path in C, so valid paths pay a single pass
+        if not _INVALID_PATH_SET.isdisjoint(path):
+            for char in _INVALID_PATH_CHARS:
+                if char in path:
+                    return f"Invalid character '{char}' in path"
+
         return None
     
     def validate_filename(self, filename: str) -> Optional[str]:
@@ -223,57 +387,58 @@ class ErrorHandler:
         if not filename:
             return "Filename cannot be empty"
         
-        if filename in ['.', '..']:
+        if filename in _DOT_NAMES:
             return f"Invalid filename: '{filename}'"
-        
+
         if len(filename) > 255:  # Typical max filename length
             return "Filename too long"
-        
+
         # Check for invalid characters
-        invalid_chars = ['<', '>', ':', '"', '|', '?', '*', '\\', '/']
-        for char in invalid_chars:
-            if char in filename:
-                return f"Invalid character '{char}' in filename"
-        
+        match = _INVALID_FILENAME_RE.search(filename)
+        if match:
+            return f"Invalid character '{match.group()}' in filename"
+
         return None
     
     def _get_command_suggestions(self, command: str) -> list:
         """
         Get command suggestions for typos.
-        
+
         Args:
             command: The mistyped command
-            
+
         Returns:
-            List of suggested commands
-        """
-        # Common commands that users might mistype
-        common_commands = [
-            'ls', 'cd', 'pwd', 'mkdir', 'rmdir', 'rm', 'cp', 'mv', 'cat', 'touch',
-            'find', 'grep', 'head', 'tail', 'wc', 'chmod', 'chown', 'stat',
-            'ps', 'top', 'free', 'df', 'uptime', 'kill', 'killall', 'who', 'whoami',
-            'uname', 'history', 'help', 'clear', 'exit', 'quit'
-        ]
-        
+            List of suggested commands, closest first
+        """
+        return list(self._suggest(command.lower()))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _suggest(command_lower: str) -> tuple:
+        """
+        Resolve suggestions for a lowercased command.
+
+        Users tend to repeat the same typos, so results are memoized;
+        the corpus is a module constant, which makes the cache safe to
+        share across instances.
+
+        Prefix-bucket hits come first — a shared two-character prefix is
+        the strongest typo signal and also catches completions (like
+        'mk' -> 'mkdir') that fall outside the edit-distance bound.
+        """
         suggestions = []
-        command_lower = command.lower()
-        
-        # Find commands with similar starting letters
-        for cmd in common_commands:
-            if cmd.startswith(command_lower[:2]) and cmd != command_lower:
+        for cmd in _BY_PREFIX.get(command_lower[:2], ()):
+            if cmd != command_lower:
                 suggestions.append(cmd)
-        
-        # Find commands with similar length and characters
-        if not suggestions:
-            for cmd in common_commands:
-                if abs(len(cmd) - len(command)) <= 1:
-                    # Simple character similarity check
-                    common_chars = set(cmd) & set(command_lower)
-                    if len(common_chars) >= min(len(cmd), len(command)) - 1:
-                        suggestions.append(cmd)
-        
-        return suggestions[:3]  # Return max 3 suggestions
-    
+
+        matches = _bk_query(_BK_TREE, command_lower, 2)
+        matches.sort()
+        for d, word in matches:
+            if d > 0 and word not in suggestions:
+                suggestions.append(word)
+
+        return tuple(suggestions[:3])
+
     def set_debug_mode(self, debug_mode: bool) -> None:
         """
         Set debug mode on or off.
@@ -283,14 +448,16 @@ class ErrorHandler:
         """
         self.debug_mode = debug_mode
     
-    def log_error(self, error: str, level: str = "ERROR") -> None:
+    def log_error(self, error: Any, level: str = "ERROR") -> None:
         """
         Log an error message.
-        
+
         Args:
-            error: The error message to log
+            error: The error message to log (str or lazy message)
             level: The log level (ERROR, WARNING, INFO)
         """
-        # In a more complete implementation, this could write to a log file
+        # In a more complete implementation, this could write to a log
+        # file. Formatting happens inside the guard, so suppressed lazy
+        # messages are never built at all.
         if self.debug_mode:
             print(f"[{level}] {error}", file=sys.stderr)
\ No newline at end of file
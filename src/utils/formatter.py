@@ -4,14 +4,94 @@ Output Formatter
 This module provides utilities for formatting terminal output consistently.
 """
 
+import functools
 import os
 import shutil
+import signal
+import sys
+import textwrap
+from itertools import zip_longest
 from typing import List, Dict, Any, Optional
 from colorama import Fore, Back, Style, init
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
+_COLOR_CODES = {
+    'red': Fore.RED,
+    'green': Fore.GREEN,
+    'blue': Fore.BLUE,
+    'yellow': Fore.YELLOW,
+    'magenta': Fore.MAGENTA,
+    'cyan': Fore.CYAN,
+    'white': Fore.WHITE,
+    'black': Fore.BLACK,
+}
+
+_STYLE_CODES = {
+    'bright': Style.BRIGHT,
+    'dim': Style.DIM,
+    'normal': Style.NORMAL,
+}
+
+# Unit suffixes for format_size, indexed by power of 1024
+_SIZE_UNITS = 'BKMGTP'
+
+# Preallocated progress-bar glyphs; slicing these is a single memcpy
+# instead of an O(width) string repetition per render
+_BAR_FULL = "█" * 1024
+_BAR_EMPTY = "░" * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _supports_color() -> bool:
+    """Check if the terminal supports colored output (probed once)."""
+    if not hasattr(sys.stdout, 'isatty') or not sys.stdout.isatty():
+        return False
+
+    # Check common terminal color support environment variables
+    term = os.environ.get('TERM', '').lower()
+    colorterm = os.environ.get('COLORTERM', '').lower()
+
+    return 'color' in colorterm or term in (
+        'xterm', 'xterm-color', 'xterm-256color', 'screen', 'screen-256color')
+
+
+@functools.lru_cache(maxsize=1)
+def _get_terminal_width() -> int:
+    """Get the terminal width (cached until the terminal is resized)."""
+    try:
+        return shutil.get_terminal_size().columns
+    except (OSError, AttributeError):
+        return 80  # Default width
+
+
+@functools.lru_cache(maxsize=8)
+def _format_user_host(username: str, hostname: str, prefix: str, reset: str) -> str:
+    """Colorized user@host prompt fragment; stable across prompt renders."""
+    return f"{prefix}{username}@{hostname}{reset}"
+
+
+@functools.lru_cache(maxsize=32)
+def _get_wrapper(width: int, indent: str) -> textwrap.TextWrapper:
+    """Reuse one TextWrapper per (width, indent) combination."""
+    return textwrap.TextWrapper(
+        width=width,
+        subsequent_indent=indent,
+        break_long_words=False,
+        break_on_hyphens=False
+    )
+
+
+if hasattr(signal, 'SIGWINCH'):
+    try:
+        # Re-probe the width on terminal resize instead of per instance
+        signal.signal(signal.SIGWINCH,
+                      lambda *_: _get_terminal_width.cache_clear())
+    except (ValueError, OSError):
+        # Not in the main thread or signals unavailable; keep the cache
+        pass
+
 
 class OutputFormatter:
     """
@@ -25,30 +105,31 @@ class OutputFormatter:
         Args:
             use_colors: Whether to use colored output
         """
-        self.use_colors = use_colors and self._supports_color()
-        self.terminal_width = self._get_terminal_width()
+        self.use_colors = use_colors and _supports_color()
+        self.terminal_width = _get_terminal_width()
+
+        # (color, style) -> ANSI prefix, precomputed so colorize is one
+        # dict lookup instead of two map constructions per call
+        self._reset = Style.RESET_ALL
+        self._ansi = {}
+        for color_name, color_code in _COLOR_CODES.items():
+            self._ansi[(color_name, None)] = color_code
+            for style_name, style_code in _STYLE_CODES.items():
+                self._ansi[(color_name, style_name)] = style_code + color_code
+
+        # Prompt constants: home/sep don't change, and the '$' symbol is
+        # colorized once instead of on every prompt render
+        self._home = os.path.expanduser('~')
+        self._sep = os.sep
+        self._prompt_symbol = self.colorize('$', 'white', 'bright')
     
     def _supports_color(self) -> bool:
         """Check if the terminal supports colored output."""
-        # Check if stdout is a terminal and supports colors
-        if not hasattr(os.sys.stdout, 'isatty') or not os.sys.stdout.isatty():
-            return False
-        
-        # Check common terminal color support environment variables
-        term = os.environ.get('TERM', '').lower()
-        colorterm = os.environ.get('COLORTERM', '').lower()
-        
-        if 'color' in colorterm or term in ['xterm', 'xterm-color', 'xterm-256color', 'screen', 'screen-256color']:
-            return True
-        
-        return False
-    
+        return _supports_color()
+
     def _get_terminal_width(self) -> int:
         """Get the terminal width."""
-        try:
-            return shutil.get_terminal_size().columns
-        except (OSError, AttributeError):
-            return 80  # Default width
+        return _get_terminal_width()
     
     def colorize(self, text: str, color: str, style: str = None) -> str:
         """
@@ -62,30 +143,18 @@ class OutputFormatter:
         Returns:
             Colorized text or original text if colors disabled
         """
-        if not self.use_colors:
+        if not self.use_colors or not text:
             return text
-        
-        color_map = {
-            'red': Fore.RED,
-            'green': Fore.GREEN,
-            'blue': Fore.BLUE,
-            'yellow': Fore.YELLOW,
-            'magenta': Fore.MAGENTA,
-            'cyan': Fore.CYAN,
-            'white': Fore.WHITE,
-            'black': Fore.BLACK,
-        }
-        
-        style_map = {
-            'bright': Style.BRIGHT,
-            'dim': Style.DIM,
-            'normal': Style.NORMAL,
-        }
-        
-        color_code = color_map.get(color.lower(), '')
-        style_code = style_map.get(style.lower(), '') if style else ''
-        
-        return f"{style_code}{color_code}{text}{Style.RESET_ALL}"
+
+        prefix = self._ansi.get((color, style))
+        if prefix is None:
+            # Slow path keeps the old case-insensitive behavior
+            prefix = self._ansi.get(
+                (color.lower(), style.lower() if style else None), '')
+
+        # Plain concatenation: fewer opcodes than the f-string since all
+        # three pieces are already strings
+        return prefix + text + self._reset if prefix else text
     
     def format_error(self, message: str) -> str:
         """
@@ -149,20 +218,19 @@ class OutputFormatter:
         """
         # Shorten directory path if it's too long
         if len(current_dir) > 30:
-            dir_parts = current_dir.split(os.sep)
+            dir_parts = current_dir.split(self._sep)
             if len(dir_parts) > 3:
-                current_dir = os.sep.join(['...'] + dir_parts[-2:])
-        
+                current_dir = self._sep.join(['...'] + dir_parts[-2:])
+
         # Replace home directory with ~
-        home_dir = os.path.expanduser('~')
-        if current_dir.startswith(home_dir):
-            current_dir = current_dir.replace(home_dir, '~', 1)
-        
+        if current_dir.startswith(self._home):
+            current_dir = current_dir.replace(self._home, '~', 1)
+
         if self.use_colors:
-            user_host = self.colorize(f"{username}@{hostname}", 'green', 'bright')
+            user_host = _format_user_host(
+                username, hostname, self._ansi[('green', 'bright')], self._reset)
             directory = self.colorize(current_dir, 'blue', 'bright')
-            prompt_symbol = self.colorize('$', 'white', 'bright')
-            return f"{user_host}:{directory}{prompt_symbol} "
+            return f"{user_host}:{directory}{self._prompt_symbol} "
         else:
             return f"{username}@{hostname}:{current_dir}$ "
     
@@ -178,29 +246,34 @@ class OutputFormatter:
         """
         if not files:
             return ""
-        
+
+        if not self.use_colors:
+            return "  ".join(f.get('name', '') for f in files)
+
+        # Hoist the ANSI prefixes once; calling colorize per entry costs
+        # a method call and dict lookup for every file in the listing
+        dir_prefix = self._ansi[('blue', 'bright')]
+        exe_prefix = self._ansi[('green', 'bright')]
+        link_prefix = self._ansi[('cyan', None)]
+        hidden_prefix = self._ansi[('white', 'dim')]
+        reset = self._reset
+
         formatted_files = []
-        
         for file_info in files:
             name = file_info.get('name', '')
             file_type = file_info.get('type', 'file')
-            
-            if self.use_colors:
-                if file_type == 'directory':
-                    formatted_name = self.colorize(name, 'blue', 'bright')
-                elif file_type == 'executable':
-                    formatted_name = self.colorize(name, 'green', 'bright')
-                elif file_type == 'symlink':
-                    formatted_name = self.colorize(name, 'cyan')
-                elif name.startswith('.'):
-                    formatted_name = self.colorize(name, 'white', 'dim')
-                else:
-                    formatted_name = name
-            else:
-                formatted_name = name
-            
-            formatted_files.append(formatted_name)
-        
+
+            if file_type == 'directory':
+                name = f"{dir_prefix}{name}{reset}"
+            elif file_type == 'executable':
+                name = f"{exe_prefix}{name}{reset}"
+            elif file_type == 'symlink':
+                name = f"{link_prefix}{name}{reset}"
+            elif name.startswith('.'):
+                name = f"{hidden_prefix}{name}{reset}"
+
+            formatted_files.append(name)
+
         return "  ".join(formatted_files)
     
     def format_table(self, headers: List[str], rows: List[List[str]], 
@@ -221,30 +294,30 @@ class OutputFormatter:
         
         max_width = max_width or self.terminal_width
         
-        # Calculate column widths
+        # Calculate column widths: transpose once and let max/map/len run
+        # the scan in C instead of nested Python loops
+        width_cap = max_width // len(headers)
+        columns = list(zip_longest(*rows, fillvalue=''))
         col_widths = []
         for i, header in enumerate(headers):
             max_col_width = len(header)
-            for row in rows:
-                if i < len(row):
-                    max_col_width = max(max_col_width, len(str(row[i])))
-            col_widths.append(min(max_col_width, max_width // len(headers)))
+            if i < len(columns):
+                max_col_width = max(max_col_width,
+                                    max(map(len, map(str, columns[i]))))
+            col_widths.append(min(max_col_width, width_cap))
         
-        # Format header
+        # Format header and separator with the prefixes hoisted once
+        separator = "-" * min(sum(col_widths) + len(headers) - 1, max_width)
         if self.use_colors:
-            formatted_headers = [self.colorize(h[:w], 'white', 'bright').ljust(w + 10) 
-                               for h, w in zip(headers, col_widths)]
+            hdr_prefix = self._ansi[('white', 'bright')]
+            reset = self._reset
+            formatted_headers = [f"{hdr_prefix}{h[:w]}{reset}".ljust(w + 10)
+                                 for h, w in zip(headers, col_widths)]
+            separator = f"{self._ansi[('white', 'dim')]}{separator}{reset}"
         else:
             formatted_headers = [h[:w].ljust(w) for h, w in zip(headers, col_widths)]
-        
-        table_lines = [" ".join(formatted_headers)]
-        
-        # Add separator
-        if self.use_colors:
-            separator = self.colorize("-" * min(sum(col_widths) + len(headers) - 1, max_width), 'white', 'dim')
-        else:
-            separator = "-" * min(sum(col_widths) + len(headers) - 1, max_width)
-        table_lines.append(separator)
+
+        table_lines = [" ".join(formatted_headers), separator]
         
         # Format data rows
         for row in rows:
@@ -270,8 +343,12 @@ class OutputFormatter:
             Formatted progress bar string
         """
         filled_width = int(width * percentage / 100)
-        bar_filled = "█" * filled_width
-        bar_empty = "░" * (width - filled_width)
+        if width <= len(_BAR_FULL):
+            bar_filled = _BAR_FULL[:filled_width]
+            bar_empty = _BAR_EMPTY[:width - filled_width]
+        else:
+            bar_filled = "█" * filled_width
+            bar_empty = "░" * (width - filled_width)
         
         if self.use_colors:
             bar_filled = self.colorize(bar_filled, 'green')
@@ -303,18 +380,26 @@ class OutputFormatter:
             max_item_length = max(len(item) for item in items)
             columns = max(1, self.terminal_width // (max_item_length + 2))
         
+        # One pass over the layout to find each column's width, so items
+        # align down their column instead of re-scanning every row
+        num_items = len(items)
+        col_widths = []
+        for c in range(columns):
+            width = 0
+            for idx in range(c, num_items, columns):
+                item_len = len(items[idx])
+                if item_len > width:
+                    width = item_len
+            col_widths.append(width + 2)
+
         formatted_lines = []
-        for i in range(0, len(items), columns):
+        for i in range(0, num_items, columns):
             row_items = items[i:i + columns]
-            # Pad items to equal width within the row
-            if len(row_items) > 1:
-                max_width = max(len(item) for item in row_items)
-                padded_items = [item.ljust(max_width + 2) for item in row_items[:-1]]
-                padded_items.append(row_items[-1])  # Don't pad the last item
-                formatted_lines.append("".join(padded_items))
-            else:
-                formatted_lines.append(row_items[0])
-        
+            # Don't pad the last item in each row
+            formatted_lines.append(
+                "".join(item.ljust(col_widths[c])
+                        for c, item in enumerate(row_items[:-1])) + row_items[-1])
+
         return "\n".join(formatted_lines)
     
     def wrap_text(self, text: str, width: Optional[int] = None, 
@@ -330,17 +415,7 @@ class OutputFormatter:
         Returns:
             Wrapped text
         """
-        import textwrap
-        
-        width = width or self.terminal_width
-        wrapper = textwrap.TextWrapper(
-            width=width,
-            subsequent_indent=indent,
-            break_long_words=False,
-            break_on_hyphens=False
-        )
-        
-        return wrapper.fill(text)
+        return _get_wrapper(width or self.terminal_width, indent).fill(text)
     
     def format_size(self, size_bytes: int, human_readable: bool = True) -> str:
         """
@@ -355,16 +430,13 @@ class OutputFormatter:
         """
         if not human_readable:
             return str(size_bytes)
-        
-        for unit in ['B', 'K', 'M', 'G', 'T']:
-            if size_bytes < 1024.0:
-                if unit == 'B':
-                    return f"{size_bytes:.0f}{unit}"
-                else:
-                    return f"{size_bytes:.1f}{unit}"
-            size_bytes /= 1024.0
-        
-        return f"{size_bytes:.1f}P"
+
+        if size_bytes < 1024:
+            return f"{size_bytes:.0f}B"
+
+        # bit_length picks the unit directly instead of dividing in a loop
+        idx = min((int(size_bytes).bit_length() - 1) // 10, 5)
+        return f"{size_bytes / (1 << (idx * 10)):.1f}{_SIZE_UNITS[idx]}"
     
     def format_duration(self, seconds: float) -> str:
         """
@@ -410,4 +482,4 @@ class OutputFormatter:
         Args:
             enabled: Whether to enable colors
         """
-        self.use_colors = enabled and self._supports_color()
\ No newline at end of file
+        self.use_colors = enabled and _supports_color()
\ No newline at end of file
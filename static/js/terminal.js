@@ -65,6 +65,25 @@ class WebTerminal {
         this.socket.on('command_result', (result) => {
             this.handleCommandResult(result);
         });
+
+        this.socket.on('command_result_batch', (results) => {
+            this.decodePayload(results).forEach((result) => this.handleCommandResult(result));
+        });
+
+        this.socket.on('broadcast_batch', (messages) => {
+            this.decodePayload(messages).forEach((message) => this.addOutputLine(message, 'info'));
+        });
+
+        // Large outputs arrive as a stream of chunks closed by command_done
+        this.socket.on('command_chunk', (chunk) => {
+            this.pendingOutput = (this.pendingOutput || '') + chunk.data;
+        });
+
+        this.socket.on('command_done', (result) => {
+            result.o = (this.pendingOutput || '') + (result.o || '');
+            this.pendingOutput = '';
+            this.handleCommandResult(result);
+        });
     }
     
     setupEventListeners() {
@@ -161,17 +180,18 @@ class WebTerminal {
     }
     
     handleCommandResult(result) {
-        // Update current directory
-        if (result.current_dir) {
-            this.updateCurrentDir(result.current_dir);
+        // Compact wire keys: o=output, e=exit code, d=cwd (sent only when
+        // it changed)
+        if (result.d) {
+            this.updateCurrentDir(result.d);
         }
-        
+
         // Show output
-        if (result.output) {
-            const cssClass = result.exit_code === 0 ? 'success' : 'error';
-            this.addOutputLine(result.output, cssClass);
+        if (result.o) {
+            const cssClass = result.e === 0 ? 'success' : 'error';
+            this.addOutputLine(result.o, cssClass);
         }
-        
+
         // Scroll to bottom
         this.scrollToBottom();
     }
@@ -312,6 +332,15 @@ class WebTerminal {
         }, 1000);
     }
     
+    decodePayload(data) {
+        // Batched events arrive as pre-serialized JSON in a binary frame;
+        // plain objects pass through untouched
+        if (data instanceof ArrayBuffer) {
+            return JSON.parse(new TextDecoder().decode(data));
+        }
+        return data;
+    }
+
     escapeHtml(text) {
         const div = document.createElement('div');
         div.textContent = text;
@@ -64,6 +64,26 @@ def test_file_operations():
     print("✓ File operations working!")
 
 
+def test_system_passthrough():
+    """Test commands that fall through to the system shell"""
+    engine = TerminalEngine()
+
+    print("\nTesting system passthrough...")
+
+    # echo isn't a built-in, file or monitor command, so it exercises the
+    # subprocess dispatch leg
+    output, code = engine.execute_command("echo hello world")
+    print(f"echo: {output.strip()}")
+    assert code == 0
+    assert output.strip() == "hello world"
+
+    # Unknown commands should report cleanly, not crash the dispatcher
+    output, code = engine.execute_command("definitely-not-a-command-xyz")
+    assert code != 0
+
+    print("✓ System passthrough working!")
+
+
 def test_ai_processor():
     """Test AI natural language processing"""
     ai = AIProcessor()
@@ -119,6 +139,7 @@ def main():
     try:
         test_basic_commands()
         test_file_operations()
+        test_system_passthrough()
         test_ai_processor()
         test_system_monitoring()
         
@@ -7,117 +7,324 @@ A web-based interface for the Python Terminal that can be hosted online.
 
 import sys
 import os
+
+# Green threads make idle WebSocket sessions cost a coroutine stack instead
+# of an OS thread each; the patch must happen before Flask is imported.
+try:
+    import eventlet
+    eventlet.monkey_patch()
+    _ASYNC_MODE = 'eventlet'
+except ImportError:
+    eventlet = None
+    _ASYNC_MODE = 'threading'
+
+import hashlib
 import json
 import threading
 import time
-from flask import Flask, render_template, request, jsonify, session
+from collections import OrderedDict, deque
+from flask import Flask, render_template, request, session, Response
 from flask_socketio import SocketIO, emit
 import uuid
 
+# orjson is a C-backed encoder that serializes straight to bytes, several
+# times faster than stdlib json; fall back to compact stdlib output when it
+# isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.terminal_engine import TerminalEngine
+from src.terminal_engine import TerminalEngine, TerminalExitRequested
 from src.utils.formatter import OutputFormatter
 
 app = Flask(__name__)
-app.config['SECRET_KEY'] = 'your-secret-key-change-in-production'
-socketio = SocketIO(app, cors_allowed_origins="*")
 
-# Store terminal sessions
-terminal_sessions = {}
+# Sessions are signed with this key; production must provide its own
+_secret_key = os.environ.get('FLASK_SECRET_KEY')
+if _secret_key is None:
+    if os.environ.get('FLASK_ENV') == 'production':
+        raise RuntimeError('FLASK_SECRET_KEY must be set when FLASK_ENV=production')
+    _secret_key = 'dev-secret-key-not-for-production'
+app.config['SECRET_KEY'] = _secret_key
+# Command output is highly compressible text; compress payloads on the wire
+# but skip tiny ones where the deflate overhead outweighs the saving. The
+# WebSocket transport negotiates permessage-deflate itself when the
+# underlying websocket library supports it.
+socketio = SocketIO(
+    app,
+    cors_allowed_origins="*",
+    async_mode=_ASYNC_MODE,
+    http_compression=True,
+    compression_threshold=256,
+)
+
+# Store terminal sessions, least-recently-used first so expiry only has to
+# look at the front of the dict. Mutated from multiple Flask threads, so
+# every access goes through the lock.
+terminal_sessions = OrderedDict()
+_sessions_lock = threading.Lock()
+
+SESSION_TIMEOUT = 3600  # seconds of inactivity before a session expires
+
+# Hard cap so a client looping on /api/session can't grow the session dict
+# without bound between cleanup passes; the least recently used session is
+# evicted first
+MAX_SESSIONS = int(os.environ.get('MAX_SESSIONS', 10000))
+
+class CommandResult:
+    """Outcome of one command execution.
+
+    Slotted so the hot path allocates one fixed-shape object instead of a
+    fresh 6-key dict per command; the payload dict is built once at the
+    serialization boundary.
+    """
+
+    __slots__ = ('command', 'output', 'exit_code', 'current_dir', 'timestamp', 'session_id')
+
+    def __init__(self, command, output, exit_code, current_dir, timestamp):
+        self.command = command
+        self.output = output
+        self.exit_code = exit_code
+        self.current_dir = current_dir
+        self.timestamp = timestamp
+        self.session_id = None
+
+    def to_wire(self):
+        """Build the compact transport payload.
+
+        Short keys (o=output, e=exit_code, t=timestamp, s=session_id,
+        d=cwd), with the cwd omitted when it hasn't changed and the echoed
+        command dropped entirely -- the client already has both.
+        """
+        payload = {
+            'o': self.output,
+            'e': self.exit_code,
+            't': self.timestamp,
+            's': self.session_id
+        }
+        if self.current_dir is not None:
+            payload['d'] = self.current_dir
+        return payload
+
+# Commands whose output is stable over a one-second window given the same
+# working directory; dashboard-style clients re-issue these in a loop, so
+# replaying the result from a small per-session cache skips the engine and
+# its syscalls entirely. ls is deliberately excluded: its output depends on
+# filesystem contents that any intervening command (touch, rm, ...) can
+# change within the window.
+_CACHEABLE_COMMANDS = frozenset(('pwd', 'whoami', 'uname', 'date'))
+_COMMAND_CACHE_MAX = 64
 
 class WebTerminalSession:
     """Represents a web terminal session for a user."""
-    
+
     def __init__(self, session_id):
         self.session_id = session_id
         self.engine = TerminalEngine()
         self.formatter = OutputFormatter(use_colors=False)  # HTML will handle colors
-        self.command_history = []
-        self.created_at = time.time()
-    
+        # Bounded so a long-lived session can't grow history without limit
+        self.command_history = deque(maxlen=1000)
+        # Monotonic so session-age arithmetic is immune to wall-clock jumps
+        self.created_at = time.monotonic()
+        self.last_access = self.created_at
+        # Last cwd reported to the client, for delta payloads
+        self._last_cwd = self.engine.get_current_directory()
+        # Short-TTL memo of idempotent command results, LRU-evicted
+        self._cache = OrderedDict()
+
+    def reset(self, session_id):
+        """Rebind a recycled session to a new id with a clean engine."""
+        self.session_id = session_id
+        self.engine.reset()
+        self.command_history.clear()
+        self.created_at = time.monotonic()
+        self.last_access = self.created_at
+        self._last_cwd = self.engine.get_current_directory()
+        self._cache.clear()
+
     def execute_command(self, command_line):
         """Execute a command and return formatted result."""
+        # One clock read per command, shared by the access stamp and payload
+        now = time.monotonic()
+        self.last_access = now
+
+        # Add to history. Users lean on a small vocabulary (ls, pwd, help,
+        # ...), so intern short commands and let repeats share one string
+        # object across histories instead of holding a copy per entry
+        if command_line.strip():
+            if len(command_line) < 32:
+                command_line = sys.intern(command_line)
+            self.command_history.append(command_line)
+
+        # Replay idempotent commands from the memo while their time bucket
+        # is still current. The working directory is part of the key so a
+        # cd in the same bucket can never replay a stale pwd.
+        first_token = command_line.split(None, 1)[0] if command_line.strip() else ''
+        if first_token in _CACHEABLE_COMMANDS:
+            cache_key = (command_line, self.engine.get_current_directory(), int(now))
+        else:
+            cache_key = None
+        if cache_key is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                return cached
+
+        # The engine reports command failures as (message, exit_code) rather
+        # than raising, so the common error case needs no exception handling
+        # here; only the exit/quit control-flow signal escapes it.
         try:
-            # Add to history
-            if command_line.strip():
-                self.command_history.append(command_line)
-            
-            # Execute command
             output, exit_code = self.engine.execute_command(command_line)
-            
-            return {
-                'command': command_line,
-                'output': output,
-                'exit_code': exit_code,
-                'current_dir': self.engine.get_current_directory(),
-                'timestamp': time.time()
-            }
-        except Exception as e:
-            return {
-                'command': command_line,
-                'output': f'Error: {str(e)}',
-                'exit_code': 1,
-                'current_dir': self.engine.get_current_directory(),
-                'timestamp': time.time()
-            }
+        except TerminalExitRequested as e:
+            output, exit_code = e, 0
+
+        # Only report the cwd when it changed (i.e. after cd); the client
+        # keeps its last known value otherwise
+        cwd = self.engine.get_current_directory()
+        if cwd == self._last_cwd:
+            cwd = None
+        else:
+            self._last_cwd = cwd
+
+        # str() covers the exit path above, where output is the exception
+        # object rather than a string (no-op otherwise; the engine already
+        # returns plain strings, including materialized error messages)
+        result = CommandResult(command_line, str(output), exit_code, cwd, now)
+
+        if cache_key is not None:
+            self._cache[cache_key] = result
+            if len(self._cache) > _COMMAND_CACHE_MAX:
+                self._cache.popitem(last=False)
+        return result
+
+class SessionPool:
+    """Bounded pool of retired WebTerminalSession objects for reuse.
+
+    Each session owns a TerminalEngine and an OutputFormatter; under
+    session churn (many short-lived visitors) recycling them avoids
+    reallocating that object graph for every new session.
+    """
+
+    def __init__(self, capacity=32):
+        self._capacity = capacity
+        self._free = []
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Return a pooled session, or None if the pool is empty."""
+        with self._lock:
+            return self._free.pop() if self._free else None
+
+    def release(self, terminal_session):
+        """Offer a retired session back to the pool."""
+        with self._lock:
+            if len(self._free) < self._capacity:
+                self._free.append(terminal_session)
+
+_session_pool = SessionPool()
+
+def _dumps(data):
+    """Encode a payload to JSON bytes once, at the response/emit boundary."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+def _json_response(data, status=200):
+    """Serialize an API response body, bypassing jsonify's indirection."""
+    return Response(_dumps(data), status=status, mimetype='application/json')
+
+# How many expired sessions one request will retire; keeps the sweep
+# amortized O(1) per call
+_CLEANUP_BATCH = 4
 
 def get_or_create_session(session_id=None):
-    """Get existing session or create a new one."""
+    """Get existing session or create a new one.
+
+    Expiry happens here, amortized: each call retires at most a few idle
+    sessions from the front of the LRU-ordered dict, so no dedicated
+    cleanup thread is needed.
+    """
     if session_id is None:
         session_id = str(uuid.uuid4())
-    
-    if session_id not in terminal_sessions:
-        terminal_sessions[session_id] = WebTerminalSession(session_id)
-    
-    return terminal_sessions[session_id], session_id
 
-def cleanup_old_sessions():
-    """Clean up sessions older than 1 hour."""
-    current_time = time.time()
-    old_sessions = []
-    
-    for session_id, terminal_session in terminal_sessions.items():
-        if current_time - terminal_session.created_at > 3600:  # 1 hour
-            old_sessions.append(session_id)
-    
-    for session_id in old_sessions:
-        del terminal_sessions[session_id]
+    now = time.monotonic()
+    evicted = []
+    with _sessions_lock:
+        for _ in range(_CLEANUP_BATCH):
+            if not terminal_sessions:
+                break
+            oldest = next(iter(terminal_sessions.values()))
+            if now - oldest.last_access <= SESSION_TIMEOUT:
+                break
+            terminal_sessions.popitem(last=False)
+            evicted.append(oldest)
 
-# Clean up old sessions periodically
-def periodic_cleanup():
-    while True:
-        time.sleep(300)  # Every 5 minutes
-        cleanup_old_sessions()
+        terminal_session = terminal_sessions.get(session_id)
+        if terminal_session is None:
+            terminal_session = _session_pool.acquire()
+            if terminal_session is None:
+                terminal_session = WebTerminalSession(session_id)
+            else:
+                terminal_session.reset(session_id)
+            terminal_sessions[session_id] = terminal_session
+            while len(terminal_sessions) > MAX_SESSIONS:
+                evicted.append(terminal_sessions.popitem(last=False)[1])
+        else:
+            # Keep the dict ordered by recency so cleanup can stop at the
+            # first session that is still fresh
+            terminal_sessions.move_to_end(session_id)
+            terminal_session.last_access = time.monotonic()
+
+    for old_session in evicted:
+        _session_pool.release(old_session)
 
-cleanup_thread = threading.Thread(target=periodic_cleanup, daemon=True)
-cleanup_thread.start()
+    return terminal_session, session_id
+
+# The terminal page is static; render it once at startup and serve the
+# cached bytes with validators so repeat hits skip the Jinja render pass
+# entirely (a request context is needed for url_for in the template)
+with app.test_request_context('/'):
+    _INDEX_HTML = render_template('terminal.html').encode('utf-8')
+_INDEX_ETAG = hashlib.md5(_INDEX_HTML).hexdigest()
 
 @app.route('/')
 def index():
     """Main terminal page."""
-    return render_template('terminal.html')
+    if request.headers.get('If-None-Match') == _INDEX_ETAG:
+        return Response(status=304)
+    return Response(_INDEX_HTML, mimetype='text/html', headers={
+        'ETag': _INDEX_ETAG,
+        'Cache-Control': 'public, max-age=300'
+    })
 
 @app.route('/api/execute', methods=['POST'])
 def execute_command():
     """Execute a terminal command via API."""
     data = request.get_json()
     command = data.get('command', '').strip()
-    session_id = data.get('session_id')
-    
+    # Fall back to the signed cookie so a client that lost its session_id
+    # (page reload, dropped state) gets its existing engine back instead of
+    # silently orphaning it behind a fresh UUID
+    session_id = data.get('session_id') or session.get('terminal_sid')
+
     terminal_session, session_id = get_or_create_session(session_id)
+    session['terminal_sid'] = session_id
     result = terminal_session.execute_command(command)
-    result['session_id'] = session_id
-    
-    return jsonify(result)
+    result.session_id = session_id
+
+    return _json_response(result.to_wire())
 
 @app.route('/api/session', methods=['POST'])
 def create_session():
     """Create a new terminal session."""
     terminal_session, session_id = get_or_create_session()
-    
-    return jsonify({
+    session['terminal_sid'] = session_id
+
+    return _json_response({
         'session_id': session_id,
         'current_dir': terminal_session.engine.get_current_directory(),
         'welcome_message': get_welcome_message()
@@ -126,57 +333,71 @@ def create_session():
 @app.route('/api/history/<session_id>')
 def get_history(session_id):
     """Get command history for a session."""
-    if session_id in terminal_sessions:
-        return jsonify({
-            'history': terminal_sessions[session_id].command_history,
-            'current_dir': terminal_sessions[session_id].engine.get_current_directory()
-        })
-    else:
-        return jsonify({'error': 'Session not found'}), 404
+    # Snapshot under the lock so a concurrent eviction can't mutate the
+    # history deque mid-copy; no I/O inside the critical section
+    with _sessions_lock:
+        terminal_session = terminal_sessions.get(session_id)
+        history = list(terminal_session.command_history) if terminal_session else None
+
+    if terminal_session is None:
+        return _json_response({'error': 'Session not found'}, status=404)
+    return _json_response({
+        'history': history,
+        'current_dir': terminal_session.engine.get_current_directory()
+    })
+
+# The examples payload never changes, so serialize it once at import and
+# serve the cached bytes with validators instead of rebuilding the dict and
+# re-encoding it on every request
+_EXAMPLES_JSON = json.dumps({
+    'basic_commands': [
+        'ls',
+        'pwd',
+        'ls -la',
+        'help',
+        'history'
+    ],
+    'file_operations': [
+        'mkdir test_folder',
+        'touch test_file.txt',
+        'cat README.md',
+        'cp file1.txt file2.txt',
+        'rm test_file.txt'
+    ],
+    'system_monitoring': [
+        'ps',
+        'free -h',
+        'df -h',
+        'uptime',
+        'whoami'
+    ],
+    'ai_natural_language': [
+        'show me the files in this directory',
+        'create a new folder called projects',
+        'what processes are running',
+        'show system memory usage',
+        'delete the test folder',
+        'copy README.md to backup'
+    ]
+}).encode('utf-8')
+_EXAMPLES_ETAG = hashlib.md5(_EXAMPLES_JSON).hexdigest()
 
 @app.route('/api/examples')
 def get_examples():
     """Get example commands and AI queries."""
-    examples = {
-        'basic_commands': [
-            'ls',
-            'pwd',
-            'ls -la',
-            'help',
-            'history'
-        ],
-        'file_operations': [
-            'mkdir test_folder',
-            'touch test_file.txt',
-            'cat README.md',
-            'cp file1.txt file2.txt',
-            'rm test_file.txt'
-        ],
-        'system_monitoring': [
-            'ps',
-            'free -h',
-            'df -h',
-            'uptime',
-            'whoami'
-        ],
-        'ai_natural_language': [
-            'show me the files in this directory',
-            'create a new folder called projects',
-            'what processes are running',
-            'show system memory usage',
-            'delete the test folder',
-            'copy README.md to backup'
-        ]
-    }
-    return jsonify(examples)
+    if request.headers.get('If-None-Match') == _EXAMPLES_ETAG:
+        return Response(status=304)
+    return Response(_EXAMPLES_JSON, mimetype='application/json', headers={
+        'Cache-Control': 'public, max-age=86400',
+        'ETag': _EXAMPLES_ETAG
+    })
 
-def get_welcome_message():
-    """Get the welcome message for the web terminal."""
-    return """
+# Built once; the welcome text is static
+_WELCOME_MESSAGE = """
 🌐 Python Web Terminal v1.0
 ==========================
 
-Welcome to the web-based Python Terminal! 
+Welcome to the web-based Python Terminal!
 
 Features:
 • Full terminal command support
@@ -192,28 +413,155 @@ Try these commands:
 • "show me the current directory" - Natural language!
 
 Type your commands below and press Enter to execute.
-    """.strip()
+""".strip()
+
+def get_welcome_message():
+    """Get the welcome message for the web terminal."""
+    return _WELCOME_MESSAGE
 
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection."""
     emit('connected', {'message': 'Connected to Python Web Terminal'})
 
+# Pending command results per connected client, drained by a background
+# flusher so bursts of commands (scripts, replay) go out as one WebSocket
+# frame instead of one frame per command.
+_pending_results = {}
+_flusher_started = False
+_FLUSH_INTERVAL = 0.01  # seconds
+_FLUSH_BATCH_MAX = 64   # flush immediately once this many results are queued
+
+
+def _emit_result_batch(sid, batch):
+    """Emit a result batch serialized once, as a single binary frame.
+
+    Pre-encoding here means the engine.io layer ships the bytes as-is
+    instead of running its own JSON encode per emit; the client decodes
+    the frame.
+    """
+    socketio.emit('command_result_batch', _dumps(batch), to=sid)
+
+
+def _result_flusher():
+    """Drain queued command results and emit them in batches."""
+    while True:
+        socketio.sleep(_FLUSH_INTERVAL)
+        for sid in list(_pending_results):
+            queue = _pending_results.get(sid)
+            if not queue:
+                continue
+            batch = []
+            while queue:
+                batch.append(queue.popleft())
+            _emit_result_batch(sid, batch)
+
+
+def _queue_result(sid, result):
+    """Queue a result for batched delivery, starting the flusher lazily."""
+    global _flusher_started
+    queue = _pending_results.get(sid)
+    if queue is None:
+        queue = _pending_results[sid] = deque()
+    queue.append(result)
+    if not _flusher_started:
+        _flusher_started = True
+        socketio.start_background_task(_result_flusher)
+    elif len(queue) >= _FLUSH_BATCH_MAX:
+        # Don't let a tight command loop grow the queue unbounded between
+        # flusher wakeups
+        batch = []
+        while queue:
+            batch.append(queue.popleft())
+        _emit_result_batch(sid, batch)
+
+
+# Broadcasts (messages for every connected client, e.g. system-wide
+# announcements) are coalesced the same way as per-client results: N queued
+# messages cost one frame per client instead of N emits each.
+_pending_broadcasts = deque()
+_BROADCAST_QUEUE_MAX = 4096
+_broadcast_flusher_started = False
+
+
+def _broadcast_flusher():
+    """Drain queued broadcasts and emit them as one batch to all clients."""
+    while True:
+        socketio.sleep(_FLUSH_INTERVAL)
+        if not _pending_broadcasts:
+            continue
+        batch = []
+        while _pending_broadcasts:
+            batch.append(_pending_broadcasts.popleft())
+        # One encode shared by every recipient instead of one per emit
+        socketio.emit('broadcast_batch', _dumps(batch))
+
+
+def queue_broadcast(message):
+    """Queue a message for batched delivery to every connected client."""
+    global _broadcast_flusher_started
+    # Backpressure: drop the oldest messages rather than letting a burst
+    # grow the queue without bound
+    while len(_pending_broadcasts) >= _BROADCAST_QUEUE_MAX:
+        _pending_broadcasts.popleft()
+    _pending_broadcasts.append(message)
+    if not _broadcast_flusher_started:
+        _broadcast_flusher_started = True
+        socketio.start_background_task(_broadcast_flusher)
+
+
+@socketio.on('disconnect')
+def handle_disconnect():
+    """Drop any undelivered results for the departing client."""
+    _pending_results.pop(request.sid, None)
+
+
+# Outputs above this size are streamed in chunks rather than sent as one
+# frame, so the client renders progressively and no single WebSocket frame
+# carries the whole payload
+_STREAM_CHUNK_SIZE = 4096
+
+
 @socketio.on('execute_command')
 def handle_command(data):
     """Handle command execution via WebSocket."""
     command = data.get('command', '').strip()
     session_id = data.get('session_id')
-    
+
     terminal_session, session_id = get_or_create_session(session_id)
     result = terminal_session.execute_command(command)
-    result['session_id'] = session_id
-    
-    emit('command_result', result)
+    result.session_id = session_id
+
+    output = result.output
+    if len(output) > _STREAM_CHUNK_SIZE:
+        # Large output (find /, cat on a big file): ship ~4 KB frames
+        # followed by the result metadata. Flush anything already queued
+        # for this client first -- chunks skip the batcher, and an earlier
+        # small result must not arrive after them.
+        sid = request.sid
+        queue = _pending_results.get(sid)
+        if queue:
+            batch = []
+            while queue:
+                batch.append(queue.popleft())
+            _emit_result_batch(sid, batch)
+        for start in range(0, len(output), _STREAM_CHUNK_SIZE):
+            socketio.emit('command_chunk',
+                          {'s': session_id, 'data': output[start:start + _STREAM_CHUNK_SIZE]},
+                          to=sid)
+        # Blank the output on a copy of the payload: the result object may
+        # live in the session memo and must keep its output for replays
+        payload = result.to_wire()
+        payload['o'] = ''
+        socketio.emit('command_done', payload, to=sid)
+    else:
+        _queue_result(request.sid, result.to_wire())
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    debug = os.environ.get('DEBUG', 'True').lower() == 'true'
+    # Off unless explicitly requested: the Werkzeug reloader forks the whole
+    # process (doubling memory) and debug mode disables optimizations
+    debug = os.environ.get('DEBUG', 'False').lower() == 'true'
     
     print(f"""
 🌐 Python Web Terminal Starting...